@@ -1,22 +1,22 @@
 from parser.file_selector import select_file
 from parser.parser import Parser
-from scheduler.greedy_scheduler import GreedyScheduler
-from scheduler.greedy_lookahead import GreedyLookahead
-from scheduler.beam_search import BeamSearchScheduler
 from serializer.serializer import SolutionSerializer
-from scheduler.beam_search_advanced import BeamSearchSchedulerAdvanced
-from scheduler.beyond_dynamic_beam_search import BeyondDynamicBeamSearchSchedulerAdvanced
-from utils.utils import Utils
-from scheduler.upper_bound_greedy import UpperBoundGreedy
+from scheduler.process_runner import run_scheduler_in_worker
 import argparse
+import gc
+import sys
+
+# Scheduler modules are imported lazily inside the menu branches below, so
+# picking e.g. the greedy scheduler does not pay the import cost of the rest.
 
 
 def main():
     parser_arg = argparse.ArgumentParser(description="Run TV scheduling algorithms")
     parser_arg.add_argument("--input", "-i", dest="input_file", help="Path to input JSON (optional)")
     parser_arg.add_argument("--scheduler", "-s", dest="scheduler",
-                            choices=["1", "2", "3", "4"],
-                            help="Scheduler to use: 1=Greedy,2=GreedyLookahead,3=Beam,4=BeamAdvanced")
+                            choices=["1", "2", "3", "4", "5", "6"],
+                            help="Scheduler to use: 1=Greedy,2=GreedyLookahead,3=Beam,"
+                                 "4=BeamAdvanced,5=UpperBound,6=BeyondDynamic")
     parser_arg.add_argument("--beam-width", type=int, default=3, help="Base beam width for beam schedulers")
     parser_arg.add_argument("--jump-cap", type=int, default=30, help="Jump cap (minutes) for beam search")
     parser_arg.add_argument("--backtrack-window", type=int, default=10, help="Backtrack window size for beam search")
@@ -28,52 +28,76 @@ def main():
     parser_arg.add_argument("--time-limit", type=float, default=None, help="Time limit (seconds) for advanced scheduler phases")
 
     args = parser_arg.parse_args()
-    file_path = select_file()
+    file_path = args.input_file if args.input_file else select_file()
     parser = Parser(file_path)
     instance = parser.parse()
-    Utils.set_current_instance(instance)
 
+    # The parsed instance is immutable from here on; freezing it keeps the
+    # cyclic collector from rescanning thousands of long-lived Program and
+    # Channel objects on every collection.
+    gc.collect()
+    gc.freeze()
+
+    total_programs = sum(len(ch.programs) for ch in instance.channels)
     print("\nOpening time:", instance.opening_time)
     print("Closing time:", instance.closing_time)
-    print("Channels:")
-    for ch in instance.channels:
-        print(f"  Channel {ch.channel_name}:")
-        for p in ch.programs:
-            print(f"    {p.program_id} | {p.start}-{p.end} | {p.genre} | Score: {p.score}")
-
-    print('\nChoose scheduler:')
-    print('1: GreedyScheduler (original)')
-    print('2: GreedyLookahead (lookahead greedy)')
-    print('3: Beam_Search (bounded lookahead)')
-    print('4: Beam_Search_Advanced (advanced lookahead)')
-    print('5: Upper Bound')
-    print('5: Beyond Dynamic Beam Search + Iterative Deepening + Advanced Backtracking')
-
-    choice = input('Select scheduler [1/2/3/4/5] (default 1): ').strip() or '1'
+    print(f"Channels: {len(instance.channels)} ({total_programs} programs)")
+
+    if args.scheduler:
+        choice = args.scheduler
+    elif not sys.stdin.isatty():
+        # no TTY to prompt on: fall back to the greedy default
+        choice = '1'
+    else:
+        print('\nChoose scheduler:')
+        print('1: GreedyScheduler (original)')
+        print('2: GreedyLookahead (lookahead greedy)')
+        print('3: Beam_Search (bounded lookahead)')
+        print('4: Beam_Search_Advanced (advanced lookahead)')
+        print('5: Upper Bound')
+        print('6: Beyond Dynamic Beam Search + Iterative Deepening + Advanced Backtracking')
+
+        choice = input('Select scheduler [1/2/3/4/5/6] (default 1): ').strip() or '1'
+
+    # Scheduling allocates a torrent of short-lived, acyclic Schedule objects;
+    # pausing the cyclic collector for the duration avoids useless scans.
+    gc.disable()
 
     if choice == '2':
+        from scheduler.greedy_lookahead import GreedyLookahead
         scheduler = GreedyLookahead(instance)
     elif choice == '3':
+        from scheduler.beam_search import BeamSearchScheduler
         scheduler = BeamSearchScheduler(instance)
     elif choice == '4':
+        from scheduler.beam_search_advanced import BeamSearchSchedulerAdvanced
         scheduler = BeamSearchSchedulerAdvanced(instance)
     elif choice == '5':
+        from scheduler.upper_bound_greedy import UpperBoundGreedy
         scheduler = UpperBoundGreedy(
         instance_data=instance,
-        fixed_duration=30,              
+        fixed_duration=30,
         include_all_preferences=True
     )
-    else:
-        scheduler = GreedyScheduler(instance)
+    elif choice == '6':
+        from scheduler.beyond_dynamic_beam_search import BeyondDynamicBeamSearchSchedulerAdvanced
         print("\nYou selected: Beyond Dynamic Beam Search + Iterative Deepening + Advanced Backtracking")
 
-        beam_width = int(input("Enter beam width (default 3): ") or 3)
-        restarts = int(input("Enter number of restarts (default 3): ") or 3)
-        iterative_input = input("Enable iterative deepening? (y/n, default y): ").strip().lower() or 'y'
-        iterative_deepening = iterative_input == 'y'
-        max_beam_multiplier = int(input("Enter max beam multiplier (default 3): ") or 3)
-        time_limit_input = input("Enter time limit in seconds (or leave empty for no limit): ").strip()
-        time_limit = float(time_limit_input) if time_limit_input else None
+        if args.scheduler:
+            # non-interactive run: take every parameter from the CLI
+            beam_width = args.beam_width
+            restarts = args.restarts
+            iterative_deepening = args.iterative_deepening
+            max_beam_multiplier = args.max_beam_multiplier
+            time_limit = args.time_limit
+        else:
+            beam_width = int(input("Enter beam width (default 3): ") or 3)
+            restarts = int(input("Enter number of restarts (default 3): ") or 3)
+            iterative_input = input("Enable iterative deepening? (y/n, default y): ").strip().lower() or 'y'
+            iterative_deepening = iterative_input == 'y'
+            max_beam_multiplier = int(input("Enter max beam multiplier (default 3): ") or 3)
+            time_limit_input = input("Enter time limit in seconds (or leave empty for no limit): ").strip()
+            time_limit = float(time_limit_input) if time_limit_input else None
 
         scheduler = BeyondDynamicBeamSearchSchedulerAdvanced(
             instance_data=instance,
@@ -96,16 +120,26 @@ def main():
         else:
             solution = scheduler.generate_solution(restarts=restarts)
     else:
+        from scheduler.greedy_scheduler import GreedyScheduler
         scheduler = GreedyScheduler(instance)
-# For advanced scheduler allow restarts to be set via CLI
-    if isinstance(scheduler, BeamSearchSchedulerAdvanced):
+
+    # For advanced scheduler allow restarts to be set via CLI
+    if choice == '6':
+        pass  # solution already generated above with the interactive parameters
+    elif choice == '4':
         # If time_limit provided use the time-aware generator
         if args.time_limit:
             solution = scheduler.generate_solution_with_time(restarts=args.restarts, time_limit=args.time_limit)
         else:
             solution = scheduler.generate_solution(restarts=args.restarts)
+    elif choice == '3':
+        # beam search holds large working state; run it in a worker process
+        # and bring only the solution back
+        solution = run_scheduler_in_worker(scheduler)
     else:
         solution = scheduler.generate_solution()
+
+    gc.enable()
     print(f"\n✓ Generated solution with total score: {solution.total_score}")
 
     algorithm_name = type(scheduler).__name__.lower()
@@ -1,8 +1,15 @@
 class Channel:
+    __slots__ = ("channel_id", "channel_name", "programs",
+                 "sorted_programs", "sorted_starts")
+
     def __init__(self, channel_id, channel_name, programs):
         self.channel_id = channel_id
         self.channel_name = channel_name
         self.programs = programs
+        # start-sorted view plus start array for bisect lookups,
+        # filled in by InstanceData when the program arrays are built
+        self.sorted_programs = None
+        self.sorted_starts = None
 
     def __repr__(self):
         return f"Channel({self.channel_id}, {self.channel_name}, Programs: {len(self.programs)})"
@@ -1,4 +1,12 @@
 class InstanceData:
+    __slots__ = ("opening_time", "closing_time", "min_duration", "max_consecutive_genre",
+                 "channels_count", "switch_penalty", "termination_penalty",
+                 "priority_blocks", "time_preferences", "channels",
+                 "genre_to_id", "prog_start", "prog_end", "prog_score",
+                 "prog_channel", "prog_channel_id", "prog_genre_id", "prog_uid", "prog_refs",
+                 "channel_prog_index", "channel_prog_starts", "uid_to_program",
+                 "prog_pref_bonus", "channel_minute_prog", "search_index")
+
     def __init__(self, opening_time, closing_time, min_duration, max_consecutive_genre,
                  channels_count, switch_penalty, termination_penalty,
                  priority_blocks, time_preferences, channels):
@@ -12,6 +20,104 @@ class InstanceData:
         self.priority_blocks = priority_blocks
         self.time_preferences = time_preferences
         self.channels = channels
+        # scratch space for schedulers to stash per-instance precomputed
+        # indexes (skip tables, bounds, ...) so restarts on the same instance
+        # do not rebuild them
+        self.search_index = {}
+        self._build_program_arrays()
+
+    def _build_program_arrays(self):
+        """
+        Flatten all channel programs into parallel arrays (structure-of-arrays)
+        so schedulers can run their inner loops over plain indices instead of
+        chasing Program/Channel objects. Genres are interned to small ints.
+        """
+        self.genre_to_id = {}
+        self.prog_start = []
+        self.prog_end = []
+        self.prog_score = []
+        self.prog_channel = []       # index into self.channels
+        self.prog_channel_id = []    # channel_id of the owning channel
+        self.prog_genre_id = []
+        self.prog_uid = []
+        self.prog_refs = []          # flat index -> Program object
+        # per-channel program indices sorted by start, plus start arrays for bisect
+        self.channel_prog_index = []
+        self.channel_prog_starts = []
+
+        self.uid_to_program = {}
+
+        for ch_idx, channel in enumerate(self.channels):
+            indices = []
+            channel.sorted_programs = sorted(channel.programs, key=lambda p: p.start)
+            channel.sorted_starts = [p.start for p in channel.sorted_programs]
+            for program in channel.sorted_programs:
+                genre_id = self.genre_to_id.setdefault(program.genre, len(self.genre_to_id))
+                program.genre_id = genre_id
+                indices.append(len(self.prog_start))
+                self.prog_start.append(program.start)
+                self.prog_end.append(program.end)
+                self.prog_score.append(program.score)
+                self.prog_channel.append(ch_idx)
+                self.prog_channel_id.append(channel.channel_id)
+                self.prog_genre_id.append(genre_id)
+                self.prog_uid.append(program.unique_id)
+                self.prog_refs.append(program)
+                if program.unique_id is not None:
+                    self.uid_to_program[program.unique_id] = program
+            self.channel_prog_index.append(indices)
+            self.channel_prog_starts.append([self.prog_start[i] for i in indices])
+
+        # Dense minute table: channel_minute_prog[ch_idx][t - opening_time] is
+        # the flat index of the program airing on that channel at minute t, or
+        # -1. Turns the per-lookup bisect into a single list index. Each
+        # program only owns minutes up to the next program's start, and the
+        # winner must actually be airing, so the table answers exactly like
+        # the bisect lookup: the rightmost start <= t wins, and minutes where
+        # that program has already ended are -1 even if an earlier-starting
+        # program still runs (nested overlaps).
+        opening = self.opening_time
+        closing = self.closing_time
+        span = max(0, closing - opening)
+        self.channel_minute_prog = []
+        for ch_idx, indices in enumerate(self.channel_prog_index):
+            row = [-1] * span
+            for k, i in enumerate(indices):
+                nxt = self.prog_start[indices[k + 1]] if k + 1 < len(indices) else closing
+                lo = max(self.prog_start[i], opening) - opening
+                hi = min(self.prog_end[i], nxt, closing) - opening
+                if lo < hi:
+                    row[lo:hi] = [i] * (hi - lo)
+            self.channel_minute_prog.append(row)
+
+        # intern preference genres into the same table so bonus checks can
+        # compare ids instead of strings
+        for pref in self.time_preferences:
+            pref.preferred_genre_id = self.genre_to_id.setdefault(
+                pref.preferred_genre, len(self.genre_to_id))
+
+        # A program's preference bonus depends only on its genre and span, so
+        # it can be resolved once here instead of per scheduler evaluation.
+        # The same holds for priority-block rejection: a program is blocked
+        # iff its fixed span overlaps a block that excludes its channel.
+        self.prog_pref_bonus = []
+        for flat_idx, program in enumerate(self.prog_refs):
+            bonus = 0
+            for pref in self.time_preferences:
+                if (program.genre_id == pref.preferred_genre_id
+                        and program.start < pref.end and program.end > pref.start):
+                    bonus += pref.bonus
+            program.pref_bonus = bonus
+            self.prog_pref_bonus.append(bonus)
+
+            channel_id = self.prog_channel_id[flat_idx]
+            blocked = False
+            for block in self.priority_blocks:
+                if (program.start < block.end and program.end > block.start
+                        and channel_id not in block.allowed_channels):
+                    blocked = True
+                    break
+            program.blocked = blocked
 
     def __repr__(self):
         return (f"InstanceData(\n"
@@ -1,4 +1,6 @@
 class PriorityBlock:
+    __slots__ = ("start", "end", "allowed_channels")
+
     def __init__(self, start, end, allowed_channels):
         self.start = start
         self.end = end
@@ -1,4 +1,7 @@
 class Program:
+    __slots__ = ("program_id", "start", "end", "genre", "score", "unique_id",
+                 "genre_id", "pref_bonus", "blocked")
+
     def __init__(self, program_id, start, end, genre, score, unique_id=None):
         self.program_id = program_id
         self.start = start
@@ -6,6 +9,14 @@ class Program:
         self.genre = genre
         self.score = score
         self.unique_id = unique_id
+        # small interned genre id and the program's total time-preference
+        # bonus, both assigned by InstanceData when the program arrays are
+        # built; comparisons on genre_id are int equality
+        self.genre_id = None
+        self.pref_bonus = None
+        # True when the program's span overlaps a priority block that does
+        # not allow its channel; resolved once by InstanceData
+        self.blocked = None
 
     def __repr__(self):
         return f"Program(ID:{self.unique_id}, {self.program_id}, {self.start}-{self.end}, {self.genre}, {self.score})"
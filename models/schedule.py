@@ -2,14 +2,18 @@ class Schedule:
     """
     The class that represents a selection (a chosen program in a channel).
     """
+    __slots__ = ("program_id", "channel_id", "start", "end", "fitness", "unique_program_id", "genre")
 
-    def __init__(self, program_id, channel_id, start, end, fitness, unique_program_id):
+    def __init__(self, program_id, channel_id, start, end, fitness, unique_program_id, genre=None):
         self.program_id = program_id
         self.channel_id = channel_id
         self.start = start
         self.end = end
         self.fitness = fitness
         self.unique_program_id = unique_program_id
+        # carried from the source Program when known, so validators can read
+        # the genre without resolving the program back by unique id
+        self.genre = genre
 
     def to_dict(self):
         """
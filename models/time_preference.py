@@ -1,9 +1,13 @@
 class TimePreference:
+    __slots__ = ("start", "end", "preferred_genre", "bonus", "preferred_genre_id")
+
     def __init__(self, start, end, preferred_genre, bonus):
         self.start = start
         self.end = end
         self.preferred_genre = preferred_genre
         self.bonus = bonus
+        # interned genre id, assigned by InstanceData
+        self.preferred_genre_id = None
 
     def __repr__(self):
         return f"TimePreference({self.start}-{self.end}, Genre: {self.preferred_genre}, Bonus: {self.bonus})"
\ No newline at end of file
@@ -0,0 +1,31 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from parser.parser import Parser
+
+
+def _parse_one(file_path):
+    return file_path, Parser(file_path).parse()
+
+
+def parse_all_files(input_dir="data/input", max_workers=None):
+    """
+    Parse every JSON file in input_dir and return {file_path: InstanceData}.
+
+    Each file is independent, so the files are parsed in parallel across a
+    process pool instead of sequentially.
+    """
+    files = sorted(
+        os.path.join(input_dir, f)
+        for f in os.listdir(input_dir)
+        if f.endswith(".json")
+    )
+
+    if not files:
+        raise FileNotFoundError(f"No JSON files found in {input_dir}")
+
+    if len(files) == 1:
+        return dict([_parse_one(files[0])])
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(_parse_one, files))
@@ -1,4 +1,5 @@
 import os
+import sys
 
 def select_file(input_dir="data/input"):
     files = [f for f in os.listdir(input_dir) if f.endswith(".json")]
@@ -6,6 +7,11 @@ def select_file(input_dir="data/input"):
     if not files:
         raise FileNotFoundError(f"No JSON files found in {input_dir}")
 
+    # non-interactive runs (piped stdin, CI) take the first file without prompting
+    if not sys.stdin.isatty():
+        files.sort()
+        return os.path.join(input_dir, files[0])
+
     print("Available files:")
     for idx, file in enumerate(files):
         print(f"{idx}: {file}")
@@ -1,5 +1,14 @@
 import json
+import os
+import pickle
 import sys
+from itertools import count
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from models.channel import Channel
 from models.instance_data import InstanceData
@@ -9,30 +18,62 @@ from models.time_preference import TimePreference
 
 
 class Parser:
+    CACHE_DIR = Path("data/.parse_cache")
+    # Bump whenever the pickled model layout changes (new InstanceData
+    # arrays, extra __slots__, ...): a blob from an older layout unpickles
+    # cleanly but is missing the new fields, and would only blow up far away
+    # at first use. Versioned filenames make stale blobs miss instead.
+    CACHE_FORMAT_VERSION = 2
+
     def __init__(self, file_path):
         self.file_path = file_path
 
+    def _cache_path(self):
+        # cache key includes mtime and size, so an edited input invalidates
+        # itself, plus the format version so stale model layouts do too
+        stat = os.stat(self.file_path)
+        stem = Path(self.file_path).stem
+        return self.CACHE_DIR / f"{stem}_v{self.CACHE_FORMAT_VERSION}_{stat.st_mtime_ns}_{stat.st_size}.pkl"
+
+    def _load_cached(self):
+        try:
+            with open(self._cache_path(), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+    def _store_cached(self, instance):
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(), "wb") as f:
+                pickle.dump(instance, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # caching is best-effort; parsing already succeeded
+
     def     parse(self):
         try:
-            with open(self.file_path, "r", encoding="utf-8", errors="ignore") as file:
-                data = json.load(file)
+            cached = self._load_cached()
+            if cached is not None:
+                return cached
+            # orjson parses the raw bytes several times faster than stdlib json;
+            # fall back to json.load when it is not installed
+            if orjson is not None:
+                with open(self.file_path, "rb") as file:
+                    data = orjson.loads(file.read())
+            else:
+                with open(self.file_path, "r", encoding="utf-8", errors="ignore") as file:
+                    data = json.load(file)
 
             channels = []
-            unique_program_id = 1
+            unique_ids = count(1)
+            intern = sys.intern  # local alias for the per-program hot loop
 
             for ch in data.get("channels", []):
-                programs = []
-                for p in ch.get("programs", []):
-                    program = Program(
-                        p["program_id"],
-                        p["start"],
-                        p["end"],
-                        p["genre"],
-                        p["score"],
-                        unique_program_id
-                    )
-                    programs.append(program)
-                    unique_program_id += 1
+                programs = [
+                    Program(p["program_id"], p["start"], p["end"],
+                            intern(p["genre"]), p["score"], uid)
+                    for p, uid in zip(ch.get("programs", []), unique_ids)
+                ]
 
                 channel_name = ch.get("channel_name", f"Channel_{ch['channel_id']}")
                 channels.append(Channel(ch["channel_id"], channel_name, programs))
@@ -41,7 +82,8 @@ class Parser:
                 PriorityBlock(
                     pb["start"],
                     pb["end"],
-                    pb["allowed_channels"]
+                    # frozenset so per-program membership checks are O(1)
+                    frozenset(pb["allowed_channels"])
                 ) for pb in data.get("priority_blocks", [])
             ]
 
@@ -67,6 +109,7 @@ class Parser:
                 channels=channels
             )
 
+            self._store_cached(instance)
             return instance
 
         except FileNotFoundError:
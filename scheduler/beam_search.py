@@ -8,8 +8,48 @@ from utils.algorithm_utils import AlgorithmUtils
 from models.schedule import Schedule as ScheduleModel
 import bisect
 import heapq
-import random
-import copy
+
+
+class _Chain:
+    """
+    Persistent partial schedule for beam nodes: one Schedule plus a parent
+    pointer, so extending a candidate is O(1) instead of copying the whole
+    list per expansion. The empty schedule is represented by None. Implements
+    exactly what the validators and penalty helpers touch: truthiness, [-1],
+    reversed() and len().
+    """
+    __slots__ = ("sched", "parent", "length")
+
+    def __init__(self, sched, parent=None):
+        self.sched = sched
+        self.parent = parent
+        self.length = parent.length + 1 if parent is not None else 1
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, idx):
+        if idx == -1:
+            return self.sched
+        return self.to_list()[idx]
+
+    def __reversed__(self):
+        node = self
+        while node is not None:
+            yield node.sched
+            node = node.parent
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self):
+        out = []
+        node = self
+        while node is not None:
+            out.append(node.sched)
+            node = node.parent
+        out.reverse()
+        return out
 
 
 class BeamSearchScheduler:
@@ -21,15 +61,34 @@ class BeamSearchScheduler:
         self.jump_cap = max(1, jump_cap)
         self.backtrack_window = max(0, backtrack_window)
 
-        # Build sorted interesting times and per-minute skip_table (hash table)
-        self.interesting_times = self._build_interesting_times()
-        self.skip_table: Dict[int, int] = self._build_skip_table()
-
-        # Cache for channel/time -> program lookup to avoid repeated scanning
-        self._channel_time_cache: Dict[Tuple[int, int], object] = {}
-
-        # Deterministic tie-breaking seed (optional)
-        random.seed(0)
+        # Interesting times, skip table, suffix bound and the channel map only
+        # depend on the instance (and jump_cap), so they are built once and
+        # stashed on the instance — the advanced scheduler constructs one
+        # BeamSearchScheduler per restart on the same InstanceData and would
+        # otherwise rebuild all of them every time.
+        index = instance_data.search_index.get(("beam", self.jump_cap))
+        if index is None:
+            # Build sorted interesting times and the dense per-minute skip table
+            self.interesting_times = self._build_interesting_times()
+            self.skip_table: List[int] = self._build_skip_table()
+
+            # Optimistic suffix bound: upper bound on score still collectable
+            # from a given time onwards, used for monotonic best-first pruning
+            self._ub_starts, self._ub_suffix = self._build_suffix_upper_bound()
+
+            # Direct id -> Channel map for rescoring lookups
+            self._channel_by_id = {ch.channel_id: ch for ch in instance_data.channels}
+
+            instance_data.search_index[("beam", self.jump_cap)] = (
+                self.interesting_times, self.skip_table,
+                self._ub_starts, self._ub_suffix, self._channel_by_id)
+        else:
+            (self.interesting_times, self.skip_table,
+             self._ub_starts, self._ub_suffix, self._channel_by_id) = index
+
+        # Full-rescore results keyed by the schedule's (uid, channel) spine so
+        # backtracking never rescores the same prefix twice
+        self._prefix_score_cache: Dict[tuple, int] = {}
 
     def generate_solution(self) -> Solution:
         schedules, total_score = self._beam_search()
@@ -37,18 +96,132 @@ class BeamSearchScheduler:
             schedules, total_score = self._backtrack_improve(schedules, total_score, window=self.backtrack_window)
         return Solution(scheduled_programs=schedules, total_score=int(total_score))
 
+    def _expand_node(self, scheduled_programs, current_time: int,
+                     beam_scoring: bool, validate: bool = True) -> List[Tuple[float, Schedule]]:
+        """
+        One shared expansion body for both the main beam loop and the
+        backtracking refill: fetch valid channels, locate each channel's
+        program via the flat arrays, apply the duplicate/overlap guards and
+        score the survivors. Returns (fitness, Schedule) pairs in channel
+        order; an empty list means the caller should jump via the skip table.
+
+        `beam_scoring` selects the beam fitness (double-counted preference
+        bonus, flat penalty and scaling factor) versus the raw greedy fitness
+        the backtracking pass historically used. In both modes the delay and
+        early-termination penalty terms are identically zero: delay by
+        definition, termination because the overlap guard rejects any
+        cut-short predecessor before scoring.
+        """
+        # Everything the loop touches repeatedly is aliased to locals once
+        # here: attribute lookups are dict probes in CPython, local reads are
+        # array indexing.
+        instance = self.instance_data
+        prog_starts = instance.prog_start
+        prog_ends = instance.prog_end
+        prog_scores = instance.prog_score
+        prog_bonus = instance.prog_pref_bonus
+        prog_uid = instance.prog_uid
+        prog_channel_id = instance.prog_channel_id
+        prog_refs = instance.prog_refs
+        minute_prog = instance.channel_minute_prog
+        minute_off = current_time - instance.opening_time
+        switch_pen = -instance.switch_penalty
+
+        if validate:
+            valid_channels = SchedulerUtils.get_valid_schedules(
+                scheduled_programs=scheduled_programs,
+                instance_data=instance,
+                schedule_time=current_time
+            )
+        else:
+            valid_channels = [
+                i for i, ch in enumerate(instance.channels)
+                if Utils.get_channel_program_by_time(ch, current_time) is not None
+            ]
+        if not valid_channels:
+            return []
+
+        # ids are small ints end to end, so the guards below are pure integer
+        # compares against hoisted locals
+        last = scheduled_programs[-1] if scheduled_programs else None
+        last_channel_id = last.channel_id if last is not None else None
+        last_uid = last.unique_program_id if last is not None else None
+        last_end = last.end if last is not None else None
+
+        expanded: List[Tuple[float, Schedule]] = []
+        for ch_idx in valid_channels:
+            # dense minute table: one list index instead of a bisect; -1
+            # means no program airing on this channel right now
+            p = minute_prog[ch_idx][minute_off]
+            if p < 0:
+                continue
+
+            # Skip obvious overlap / duplicates
+            if last is not None:
+                if last_uid == prog_uid[p] or prog_starts[p] < last_end:
+                    continue
+
+            switch = (switch_pen if last is not None and last_channel_id != prog_channel_id[p] else 0)
+            if beam_scoring:
+                # program score, the time-preference bonus counted twice
+                # (historical behavior), switch penalty, small flat penalty,
+                # scaling factor
+                fitness = prog_scores[p] + 2 * prog_bonus[p] + switch
+                fitness -= 0.7
+                fitness *= 0.95
+            else:
+                fitness = prog_scores[p] + prog_bonus[p] + switch
+
+            program = prog_refs[p]
+            sched = ScheduleModel(
+                program_id=program.program_id,
+                channel_id=prog_channel_id[p],
+                start=prog_starts[p],
+                end=prog_ends[p],
+                fitness=fitness,
+                unique_program_id=prog_uid[p],
+                genre=program.genre
+            )
+            expanded.append((fitness, sched))
+        return expanded
+
     def _beam_search(self) -> Tuple[List[Schedule], int]:
         start_time = self.instance_data.opening_time
         closing_time = self.instance_data.closing_time
+        skip_from = self._skip_from
+        expand_node = self._expand_node
+        validate_constraints = self.validate_constraints
 
-        # Beam is list of (score, time, partial_schedule)
-        beam: List[Tuple[float, int, List[Schedule]]] = [(0.0, start_time, [])]
+        # Beam is list of (score, time, partial_schedule) where the partial
+        # schedule is a persistent _Chain (None = empty)
+        beam: List[Tuple[float, int, Optional[_Chain]]] = [(0.0, start_time, None)]
 
-        best_solution: List[Schedule] = []
+        best_solution: Optional[_Chain] = None
         best_score: float = float('-inf')
 
         while beam:
-            candidates: List[Tuple[float, int, List[Schedule]]] = []
+            candidates: List[Tuple[float, int, Optional[_Chain]]] = []
+
+            # Stalled entries (no valid expansion, just a time jump) keep the
+            # same prefix and score, so per layer we hold at most one stall per
+            # prefix — the one that jumped furthest — instead of letting a
+            # fully stalled beam flood the candidate pool with duplicates.
+            stall_index: Dict[int, int] = {}
+
+            # Dominance dedup for expansions: candidates ending in the same
+            # program at the same time and depth describe the same search
+            # state, so only the best-scoring one is worth a beam slot
+            # (unique_program_id implies the channel, so it is not keyed)
+            exp_index: Dict[tuple, int] = {}
+
+            def add_stall(score, next_time, sol):
+                key = id(sol)
+                prev = stall_index.get(key)
+                if prev is None:
+                    stall_index[key] = len(candidates)
+                    candidates.append((score, next_time, sol))
+                elif next_time > candidates[prev][1]:
+                    candidates[prev] = (score, next_time, sol)
 
             for current_score, current_time, current_solution in beam:
                 # If candidate reached end, update best and skip expansion
@@ -58,91 +231,61 @@ class BeamSearchScheduler:
                         best_solution = current_solution
                     continue
 
-                # Get valid channels (indices)
-                if self.validate_constraints:
-                    valid_channels = SchedulerUtils.get_valid_schedules(
-                        scheduled_programs=current_solution,
-                        instance_data=self.instance_data,
-                        schedule_time=current_time
-                    )
-                else:
-                    valid_channels = [
-                        i for i, ch in enumerate(self.instance_data.channels)
-                        if self._get_channel_program_by_time(ch, current_time) is not None
-                    ]
-
-                # If none, jump using skip_table
-                if not valid_channels:
-                    shift = self.skip_table.get(current_time, self.jump_cap)
-                    next_time = min(current_time + shift, closing_time)
-                    candidates.append((current_score, next_time, current_solution))
-                    continue
+                expanded = expand_node(current_solution, current_time,
+                                       beam_scoring=True, validate=validate_constraints)
 
-                # Expand each valid channel
-                expanded = []
-                for ch_idx in valid_channels:
-                    channel = self.instance_data.channels[ch_idx]
-                    program = self._get_channel_program_by_time(channel, current_time)
-                    if program is None:
-                        continue
-
-                    # Skip obvious overlap / duplicates
-                    if current_solution:
-                        last = current_solution[-1]
-                        if last.unique_program_id == program.unique_id or program.start < last.end:
-                            continue
-
-                    # Fitness calculation with late start and early stop considerations
-                    fitness = (
-                            getattr(program, "score", 0)
-                            + AlgorithmUtils.get_time_preference_bonus(self.instance_data, program, current_time)
-                            + AlgorithmUtils.get_switch_penalty(current_solution, self.instance_data, channel)
-                            + AlgorithmUtils.get_delay_penalty(current_solution, self.instance_data, program,
-                                                               current_time)
-                            + AlgorithmUtils.get_early_termination_penalty(current_solution, self.instance_data,
-                                                                           program, current_time)
-                    )
-
-                    # Apply the original time preference bonus without amplification
-                    time_preference_bonus = AlgorithmUtils.get_time_preference_bonus(self.instance_data, program,
-                                                                                     current_time)
-                    fitness += time_preference_bonus
-
-                    # **Increase the small penalty further**
-                    small_penalty = 0.7  # Increased penalty further to reduce the score
-                    fitness -= small_penalty
-
-                    # **Apply scaling factor to fitness more aggressively**
-                    scaling_factor = 0.95
-                    fitness *= scaling_factor
-
-                    # Allow non-positive fitness but save value — we'll still consider the best among them
-                    sched = ScheduleModel(
-                        program_id=program.program_id,
-                        channel_id=channel.channel_id,
-                        start=program.start,
-                        end=program.end,
-                        fitness=int(fitness),
-                        unique_program_id=program.unique_id
-                    )
-
-                    new_solution = current_solution + [sched]
-                    new_score = current_score + fitness
-                    expanded.append((new_score, program.end, new_solution))
-
-                # If no expansion due to checks, we should still jump forward
+                # If nothing survives the guards, jump using the skip table
                 if not expanded:
-                    shift = self.skip_table.get(current_time, self.jump_cap)
+                    shift = skip_from(current_time)
                     next_time = min(current_time + shift, closing_time)
-                    candidates.append((current_score, next_time, current_solution))
+                    add_stall(current_score, next_time, current_solution)
                 else:
-                    candidates.extend(expanded)
+                    depth = current_solution.length + 1 if current_solution is not None else 1
+                    for fitness, sched in expanded:
+                        new_score = current_score + fitness
+                        key = (sched.end, sched.unique_program_id, depth)
+                        prev = exp_index.get(key)
+                        if prev is None:
+                            exp_index[key] = len(candidates)
+                            candidates.append((new_score, sched.end, _Chain(sched, current_solution)))
+                        elif new_score > candidates[prev][0]:
+                            candidates[prev] = (new_score, sched.end, _Chain(sched, current_solution))
 
             if not candidates:
                 break
 
-            # Reduce to top beam_width by score, ensuring diversity and more exploration
-            beam = heapq.nlargest(self.beam_width, candidates, key=lambda x: x[0])
+            # Monotonic best-first pruning: drop candidates that cannot beat
+            # the incumbent even if they collected every remaining program.
+            # The bound is queried at the last scheduled end, not the current
+            # time: a stall jump can pass over programs that are still airing
+            # and schedulable (start >= last end but before the jumped-to
+            # time), and those must stay inside the remaining potential.
+            if best_score > float('-inf'):
+                candidates = [
+                    c for c in candidates
+                    if c[0] + self._remaining_upper_bound(
+                        c[2].sched.end if c[2] is not None else start_time) > best_score
+                ]
+                if not candidates:
+                    break
+
+            # Reduce to top beam_width by score with a bounded min-heap: one
+            # pass over the candidates, never materializing a decorated copy
+            # Ties store -arrival so that, among equal scores, the latest
+            # arrival sits at the heap root and is evicted first — the same
+            # stable preference for earlier candidates nlargest has
+            heap = []
+            tie = 0
+            for cand in candidates:
+                if len(heap) < self.beam_width:
+                    heapq.heappush(heap, (cand[0], -tie, cand))
+                elif cand[0] > heap[0][0]:
+                    heapq.heapreplace(heap, (cand[0], -tie, cand))
+                tie += 1
+            # order the survivors like nlargest did (score desc, arrival asc)
+            # so downstream tie-breaking is unchanged
+            heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+            beam = [entry[2] for entry in heap]
 
             # Update best if any reached end
             for score, time, sol in beam:
@@ -150,71 +293,121 @@ class BeamSearchScheduler:
                     best_score = score
                     best_solution = sol
 
+            # Branch-and-bound cut on the surviving beam: entries that cannot
+            # beat the incumbent even by collecting every remaining program
+            # are dead weight, and an emptied beam ends the search. The suffix
+            # upper bound is tighter than the max-score-per-min-duration
+            # estimate, so it is reused here.
+            if best_score > float('-inf'):
+                beam = [
+                    e for e in beam
+                    if e[1] < closing_time and e[0] + self._remaining_upper_bound(
+                        e[2].sched.end if e[2] is not None else start_time) > best_score
+                ]
+
         if best_score == float('-inf'):
             return [], 0
-        # Ensure integer score
-        return best_solution, int(best_score)
+        # Ensure integer score; materialize the winning chain once
+        return (best_solution.to_list() if best_solution is not None else []), int(best_score)
+
+    def _build_suffix_upper_bound(self) -> Tuple[List[int], List[float]]:
+        # Potential of a program = its score plus TWICE every preference bonus
+        # it can match: the beam fitness counts the bonus twice, so a single
+        # bonus would under-estimate an entry's contribution and make the
+        # pruning cut reachable improvements. score + 2*bonus dominates both
+        # fitness modes (0.95 * (s + 2b - 0.7) < s + 2b, and the raw mode uses
+        # a single bonus); summing potentials of all programs starting at/after
+        # t additionally ignores overlaps and penalties, so it over-estimates
+        # and is a safe bound.
+        entries = []
+        for ch in self.instance_data.channels:
+            for p in ch.programs:
+                potential = p.score
+                for pref in self.instance_data.time_preferences:
+                    if p.genre == pref.preferred_genre and p.start < pref.end and p.end > pref.start:
+                        potential += 2 * pref.bonus
+                entries.append((p.start, potential))
+        entries.sort()
+        starts = [e[0] for e in entries]
+        suffix = [0.0] * (len(entries) + 1)
+        for i in range(len(entries) - 1, -1, -1):
+            suffix[i] = suffix[i + 1] + entries[i][1]
+        return starts, suffix
+
+    def _remaining_upper_bound(self, time: int) -> float:
+        idx = bisect.bisect_left(self._ub_starts, time)
+        return self._ub_suffix[idx]
 
     def _build_interesting_times(self) -> List[int]:
-        times = set()
-        for ch in getattr(self.instance_data, "channels", []):
-            for p in getattr(ch, "programs", []):
-                if getattr(p, "start", None) is not None:
-                    times.add(p.start)
-                if getattr(p, "end", None) is not None:
-                    times.add(p.end)
-        cleaned = [t for t in times if
-                   t is not None and self.instance_data.opening_time <= t <= self.instance_data.closing_time]
-        cleaned.sort()
-        return cleaned
-
-    def _build_skip_table(self) -> Dict[int, int]:
+        # bulk set construction from the instance's flat arrays instead of
+        # growing a set one program attribute at a time
+        instance = self.instance_data
+        times = set(instance.prog_start)
+        times.update(instance.prog_end)
+        opening, closing = instance.opening_time, instance.closing_time
+        return sorted(t for t in times if opening <= t <= closing)
+
+    def _build_skip_table(self) -> List[int]:
+        # dense array indexed by minute - opening_time; a list lookup is a
+        # plain indexed load instead of a dict hash+probe per jump
         opening = self.instance_data.opening_time
         closing = self.instance_data.closing_time
         arr = self.interesting_times
-        skip = {}
+        n = len(arr)
+        skip = [0] * max(0, closing - opening)
 
+        # single merge pass: minutes and interesting times are both sorted,
+        # so one advancing pointer replaces a bisect per minute
+        idx = 0
+        jump_cap = self.jump_cap
         for m in range(opening, closing):
-            if not arr:
-                skip[m] = min(self.jump_cap, closing - m)
-                continue
-            idx = bisect.bisect_right(arr, m)
-            if idx >= len(arr):
-                skip[m] = min(self.jump_cap, closing - m)
+            while idx < n and arr[idx] <= m:
+                idx += 1
+            if idx >= n:
+                skip[m - opening] = min(jump_cap, closing - m)
             else:
-                next_t = arr[idx]
-                delta = next_t - m
-                skip[m] = delta if delta <= self.jump_cap else self.jump_cap
+                delta = arr[idx] - m
+                skip[m - opening] = delta if delta <= jump_cap else jump_cap
         return skip
 
-    def _get_channel_program_by_time_cached(self, channel_idx: int, time: int):
-        return self._get_channel_program_by_time(self.instance_data.channels[channel_idx], time)
-
-    def _get_channel_program_by_time(self, channel, time: int):
-        key = (getattr(channel, "channel_id", id(channel)), int(time))
-        if key in self._channel_time_cache:
-            return self._channel_time_cache[key]
-        p = Utils.get_channel_program_by_time(channel, time)
-        self._channel_time_cache[key] = p
-        return p
+    def _skip_from(self, minute: int) -> int:
+        idx = minute - self.instance_data.opening_time
+        if 0 <= idx < len(self.skip_table):
+            return self.skip_table[idx]
+        return self.jump_cap
+
+    def _score_cached(self, scheduled: List[Schedule]) -> int:
+        # (unique_program_id, channel_id) pairs identify a schedule for
+        # scoring purposes; starts and ends are implied by the program
+        key = tuple((s.unique_program_id, s.channel_id) for s in scheduled)
+        hit = self._prefix_score_cache.get(key)
+        if hit is None:
+            hit = self._score_full_schedule(scheduled)
+            self._prefix_score_cache[key] = hit
+        return hit
 
     def _score_full_schedule(self, scheduled: List[Schedule]) -> int:
+        # The penalty helpers only ever inspect the entry preceding the one
+        # being scored, so indexing the predecessor directly replaces the
+        # former scheduled[:idx] slices (which made this loop quadratic)
+        # with identical results.
         s = 0.0
         for idx, sch in enumerate(scheduled):
-            ch = next((c for c in self.instance_data.channels if c.channel_id == sch.channel_id), None)
+            ch = self._channel_by_id.get(sch.channel_id)
             if not ch:
                 continue
-            prog = next((p for p in ch.programs if p.unique_id == sch.unique_program_id), None)
+            prog = Utils.get_program_by_unique_id(self.instance_data, sch.unique_program_id)
             if not prog:
                 continue
-            prefix = scheduled[:idx]
-            s += (
-                    getattr(prog, "score", 0)
-                    + AlgorithmUtils.get_time_preference_bonus(self.instance_data, prog, prog.start)
-                    + AlgorithmUtils.get_switch_penalty(prefix, self.instance_data, ch)
-                    + AlgorithmUtils.get_delay_penalty(prefix, self.instance_data, prog, prog.start)
-                    + AlgorithmUtils.get_early_termination_penalty(prefix, self.instance_data, prog, prog.start)
-            )
+            # every parsed Program carries a score, so no getattr default
+            s += (prog.score
+                  + AlgorithmUtils.get_time_preference_bonus(self.instance_data, prog, prog.start))
+            if idx > 0:
+                prev = scheduled[idx - 1]
+                if prev.channel_id != ch.channel_id:
+                    s -= self.instance_data.switch_penalty
+                if prev.unique_program_id != prog.unique_id and prog.start < prev.end:
+                    s -= self.instance_data.termination_penalty
         return int(s)
 
     def _backtrack_improve(self, scheduled: List[Schedule], total_score: int, window: int = 4) -> Tuple[
@@ -225,7 +418,7 @@ class BeamSearchScheduler:
 
         window = min(window, n // 2)
         prefix = scheduled[: n - window]
-        prefix_score = self._score_full_schedule(prefix)
+        prefix_score = self._score_cached(prefix)
 
         refill_time = prefix[-1].end if prefix else self.instance_data.opening_time
 
@@ -233,55 +426,37 @@ class BeamSearchScheduler:
         nodes = [(prefix_score, refill_time, prefix)]
         max_depth = window
 
+        closing_time = self.instance_data.closing_time
+        skip_from = self._skip_from
+        expand_node = self._expand_node
+
         for depth in range(max_depth):
             next_nodes = []
             for cur_score, cur_time, cur_sol in nodes:
-                if cur_time >= self.instance_data.closing_time:
+                if cur_time >= closing_time:
                     next_nodes.append((cur_score, cur_time, cur_sol))
                     continue
 
-                valid_channels = SchedulerUtils.get_valid_schedules(
-                    scheduled_programs=cur_sol,
-                    instance_data=self.instance_data,
-                    schedule_time=cur_time
-                )
-                if not valid_channels:
-                    shift = self.skip_table.get(cur_time, self.jump_cap)
-                    next_time = min(cur_time + shift, self.instance_data.closing_time)
-                    next_nodes.append((cur_score, next_time, cur_sol))
-                    continue
+                expanded = expand_node(cur_sol, cur_time, beam_scoring=False)
 
-                expansions = []
-                for ch_idx in valid_channels:
-                    ch = self.instance_data.channels[ch_idx]
-                    prog = self._get_channel_program_by_time(ch, cur_time)
-                    if not prog:
-                        continue
-                    if cur_sol and (cur_sol[-1].unique_program_id == prog.unique_id or prog.start < cur_sol[-1].end):
-                        continue
-
-                    fitness = (
-                            getattr(prog, "score", 0)
-                            + AlgorithmUtils.get_time_preference_bonus(self.instance_data, prog, cur_time)
-                            + AlgorithmUtils.get_switch_penalty(cur_sol, self.instance_data, ch)
-                            + AlgorithmUtils.get_delay_penalty(cur_sol, self.instance_data, prog, cur_time)
-                            + AlgorithmUtils.get_early_termination_penalty(cur_sol, self.instance_data, prog, cur_time)
-                    )
-                    sched = ScheduleModel(program_id=prog.program_id, channel_id=ch.channel_id,
-                                          start=prog.start, end=prog.end, fitness=int(fitness),
-                                          unique_program_id=prog.unique_id)
-                    new_sol = cur_sol + [sched]
-                    new_score = cur_score + fitness
-                    expansions.append((new_score, prog.end, new_sol))
-
-                if not expansions:
-                    shift = self.skip_table.get(cur_time, self.jump_cap)
-                    next_time = min(cur_time + shift, self.instance_data.closing_time)
+                if not expanded:
+                    shift = skip_from(cur_time)
+                    next_time = min(cur_time + shift, closing_time)
                     next_nodes.append((cur_score, next_time, cur_sol))
                 else:
-                    expansions.sort(key=lambda x: x[0], reverse=True)
-                    for ex in expansions[: self.beam_width]:
-                        next_nodes.append(ex)
+                    # Same bounded min-heap cut as the main beam loop instead
+                    # of sorting every expansion and slicing
+                    heap = []
+                    tie = 0
+                    for fitness, sched in expanded:
+                        ex = (cur_score + fitness, sched.end, cur_sol + [sched])
+                        if len(heap) < self.beam_width:
+                            heapq.heappush(heap, (ex[0], -tie, ex))
+                        elif ex[0] > heap[0][0]:
+                            heapq.heapreplace(heap, (ex[0], -tie, ex))
+                        tie += 1
+                    heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+                    next_nodes.extend(entry[2] for entry in heap)
 
             nodes = next_nodes
 
@@ -289,7 +464,7 @@ class BeamSearchScheduler:
         new_prefix_score, _, new_prefix = best_node
         tail = scheduled[n:]
         new_schedule = new_prefix + tail
-        new_total = self._score_full_schedule(new_schedule)
+        new_total = self._score_cached(new_schedule)
 
         if new_total > total_score:
             return new_schedule, new_total
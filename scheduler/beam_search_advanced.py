@@ -1,3 +1,4 @@
+import os
 import random
 import math
 import traceback
@@ -7,6 +8,20 @@ from numbers import Number
 from models.instance_data import InstanceData
 from models.solution import Solution
 from scheduler.beam_search import BeamSearchScheduler
+from scheduler.process_runner import map_over_instance
+
+
+def _run_restart_in_worker(instance_data, params):
+    # module-level so the process pool can pickle it; the instance itself is
+    # installed once per worker by the pool initializer
+    dynamic_width, jump_cap, backtrack_window = params
+    scheduler = BeamSearchScheduler(
+        instance_data=instance_data,
+        beam_width=dynamic_width,
+        jump_cap=jump_cap,
+        backtrack_window=backtrack_window,
+    )
+    return scheduler.generate_solution()
 
 
 class BeamSearchSchedulerAdvanced:
@@ -75,30 +90,14 @@ class BeamSearchSchedulerAdvanced:
             return -float("inf")
         return float(score)
 
-    def _run_single_restart(self, restart_index: int, restarts: int) -> Optional[Solution]:
+    def _run_single_restart_params(self, params) -> Optional[Solution]:
+        # in-process fallback path; same work a pool worker would do
         try:
-            seed = self._seed_random()
-            dynamic_width = max(1, int(self.beam_width * random.uniform(0.8, 1.5)))
-            print(f"[Restart {restart_index + 1}/{restarts}] Beam width = {dynamic_width}, Seed = {seed}")
-
+            dynamic_width, _, _ = params
             scheduler = self._create_scheduler(dynamic_width)
-
-            solution = scheduler.generate_solution()
-
-            if solution is None:
-                print(f"WARNING: Restart {restart_index + 1} produced None solution.")
-                return None
-
-            score = self._safe_get_score(solution)
-            if score == -float("inf"):
-                print(f"WARNING: Restart {restart_index + 1} returned invalid score; ignoring result.")
-                return None
-
-            print(f"  → Restart {restart_index + 1} finished with score: {score}")
-            return solution
-
+            return scheduler.generate_solution()
         except Exception as exc:
-            print(f"WARNING: Exception during restart {restart_index + 1}: {exc}")
+            print(f"WARNING: Exception during restart: {exc}")
             traceback.print_exc()
             return None
 
@@ -112,15 +111,44 @@ class BeamSearchSchedulerAdvanced:
         self._restarts_run = 0
         self._best_score_history.clear()
 
+        # The restarts are independent beam runs merged by max score, so they
+        # are dispatched to a process pool. Seeds and dynamic widths are drawn
+        # in the parent first (same RNG sequence as the sequential path) so
+        # runs stay reproducible per seed.
+        params = []
         for r in range(restarts):
+            seed = self._seed_random()
+            dynamic_width = max(1, int(self.beam_width * random.uniform(0.8, 1.5)))
+            print(f"[Restart {r + 1}/{restarts}] Beam width = {dynamic_width}, Seed = {seed}")
+            params.append((dynamic_width, self.jump_cap, self.backtrack_window))
+
+        solutions: List[Optional[Solution]] = []
+        if restarts == 1:
+            # no point paying pool startup for a single run
+            solutions.append(self._run_single_restart_params(params[0]))
+        else:
+            try:
+                workers = min(restarts, os.cpu_count() or 1)
+                solutions = map_over_instance(_run_restart_in_worker, self.instance_data,
+                                              params, max_workers=workers)
+            except Exception as exc:
+                print(f"WARNING: Parallel restarts failed ({exc}); falling back to sequential runs.")
+                traceback.print_exc()
+                solutions = [self._run_single_restart_params(p) for p in params]
+
+        for r, solution in enumerate(solutions):
             self._restarts_run += 1
-            solution = self._run_single_restart(r, restarts)
 
             if solution is None:
+                print(f"WARNING: Restart {r + 1} produced None solution.")
                 continue
 
             score = self._safe_get_score(solution)
+            if score == -float("inf"):
+                print(f"WARNING: Restart {r + 1} returned invalid score; ignoring result.")
+                continue
 
+            print(f"  → Restart {r + 1} finished with score: {score}")
             self._best_score_history.append(score)
 
             if score > best_score:
@@ -1,12 +1,15 @@
 import math
+import os
 import traceback
 import time
+from collections import deque
 from typing import Optional, List, Tuple
 from numbers import Number
 
 from models.instance_data import InstanceData
 from models.solution import Solution
 from scheduler.beam_search import BeamSearchScheduler
+from scheduler.process_runner import map_over_instance
 from models.schedule import Schedule as ScheduleModel
 from models.schedule import Schedule
 from utils.utils import Utils
@@ -15,6 +18,19 @@ from validator.validator import Validator
 from utils.algorithm_utils import AlgorithmUtils
 
 
+def _run_restart_in_worker(instance_data, params):
+    # module-level so the process pool can pickle it; the instance itself is
+    # installed once per worker by the pool initializer
+    dynamic_width, jump_cap, backtrack_window = params
+    scheduler = BeamSearchScheduler(
+        instance_data=instance_data,
+        beam_width=dynamic_width,
+        jump_cap=jump_cap,
+        backtrack_window=backtrack_window,
+    )
+    return scheduler.generate_solution()
+
+
 class BeyondDynamicBeamSearchSchedulerAdvanced:
     def __init__(
         self,
@@ -55,10 +71,53 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         self.log_path = log_path
 
         self._restarts_run: int = 0
-        self._best_score_history: List[float] = []
+        # stagnation detection only ever reads the last two entries, so the
+        # history is a bounded window rather than an ever-growing list
+        self._best_score_history: deque = deque(maxlen=64)
         self._last_seed: Optional[int] = None
         self._prev_restart_best: Optional[float] = None
 
+        # One-time lookup indexes: the genre checks and rescoring loops below
+        # resolve programs by (channel_id, time) constantly, and the original
+        # linear channel scan per call dominated their cost.
+        self._channel_by_id = {ch.channel_id: ch for ch in instance_data.channels}
+        self._channel_idx_by_id = {ch.channel_id: i for i, ch in enumerate(instance_data.channels)}
+
+        # Optimistic global score bound. Per entry the beam fitness is
+        # 0.95 * (score + 2*bonus + penalties - 0.7) < score + 2*bonus, so the
+        # double-counted bonus must be credited in full or the bound stops
+        # dominating real solutions. For the entry count: the min-duration
+        # check gates the pick time against the previous entry's *start*, so a
+        # successor only has to clear the previous *end* and picks can land
+        # closer than min_duration apart — but entry k+2 starts strictly after
+        # entry k's pick time plus min_duration, so starts advance by more
+        # than min_duration every second entry, bounding the count at
+        # 2 * ceil(span / min_duration) + 1. Lets iterative deepening stop
+        # once the incumbent provably cannot be beaten.
+        span = max(0, instance_data.closing_time - instance_data.opening_time)
+        min_dur = instance_data.min_duration
+        cap = (2 * -(-span // min_dur) + 1) if min_dur > 0 else len(instance_data.prog_score)
+        per_program = sorted((s + 2 * b for s, b in zip(instance_data.prog_score, instance_data.prog_pref_bonus)),
+                             reverse=True)
+        self._global_upper_bound = sum(per_program[:cap])
+
+        # Scoring tunables never change for the lifetime of the instance, so
+        # the defaulted-getattr chains are resolved once here; the per-entry
+        # scorer steps then read plain attributes instead of re-deriving them
+        self._overlap_penalty = int(getattr(instance_data, "overlap_penalty", 10_000))
+        self._misorder_penalty = int(getattr(instance_data, "misorder_penalty", 1_000))
+        self._genre_window = max(1, int(getattr(instance_data, "genre_window", 3)))
+        self._genre_diversity_bonus = int(getattr(instance_data, "genre_diversity_bonus", 5))
+        self._same_genre_chain_penalty = int(getattr(instance_data, "same_genre_chain_penalty", 8))
+        self._switch_penalty = int(getattr(instance_data, "switch_penalty", 0))
+        self._genre_limit = int(
+            getattr(instance_data, "max_same_gen_R",
+                    getattr(instance_data, "max_consecutive_genre",
+                            getattr(instance_data, "genre_diversity_limit", 2))))
+        # one bit per genre, assigned on first sight; lets the diversity
+        # window count unique genres with a popcount instead of building a set
+        self._genre_bit: dict = {}
+
         self._validate_constructor_params()
 
     def _validate_constructor_params(self) -> None:
@@ -117,10 +176,13 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
             self.beam_width = min(int(self.beam_width * 2), int(self.beam_width * self.max_beam_multiplier))
             print(f"[AdaptiveRestart] Stagnation detected, new jump_cap={self.jump_cap}, beam_width={self.beam_width}")
 
-    def _refill_window(self, prefix: List[Schedule], window: int, trials: int = 1) -> Tuple[List[Schedule], int]:
+    def _refill_window(self, prefix: List[Schedule], window: int, trials: int = 1,
+                       scheduler: Optional[BeamSearchScheduler] = None) -> Tuple[List[Schedule], int]:
         temp_sched = prefix.copy()
-        local_beam = max(1, min(self.beam_width, 6))
-        bs = self._create_scheduler(local_beam)
+        if scheduler is not None:
+            bs = scheduler
+        else:
+            bs = self._create_scheduler(max(1, min(self.beam_width, 6)))
 
         fake_tail = [
             ScheduleModel(program_id="_pad", channel_id=-1, start=0, end=0, fitness=0, unique_program_id="_pad")
@@ -140,6 +202,14 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         trials_used = 0
         max_trials = max(1, max_trials)
 
+        # every trial shares prefixes of the incoming schedule
+        prefix_states = self._genre_prefix_states(scheduled)
+        score_states = self._score_states(scheduled)
+
+        # one beam scheduler serves every refill trial; its prefix-score
+        # memoization then carries over between trials too
+        refill_bs = self._create_scheduler(max(1, min(self.beam_width, 6)))
+
         W = min(self.backtrack_window, n)
         for window in range(1, W + 1):
             if trials_used >= max_trials:
@@ -150,7 +220,7 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
             for start_idx in range(0, last_start + 1, step_size):
                 prefix = scheduled[:start_idx]
                 try:
-                    candidate, _ = self._refill_window(prefix, window, trials=1)
+                    candidate, _ = self._refill_window(prefix, window, trials=1, scheduler=refill_bs)
                 except Exception:
                     trials_used += 1
                     if trials_used >= max_trials:
@@ -159,13 +229,16 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
                 tail = scheduled[start_idx + window :]
                 full_candidate = candidate + tail
 
-                if not self._respects_genre_limit(full_candidate):
+                # only the refilled window and what follows can change the
+                # genre streaks; resume from the shared prefix state
+                if not self._respects_genre_limit_from(full_candidate, start_idx,
+                                                       prefix_states[start_idx]):
                     trials_used += 1
                     if trials_used >= max_trials:
                         break
                     continue
 
-                score_full = self._score_full_schedule(full_candidate)
+                score_full = self._score_resume(full_candidate, start_idx, score_states[start_idx])
                 if score_full > best_score:
                     best_score = score_full
                     best_sched = full_candidate
@@ -178,52 +251,80 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
     def _local_search_replace(self, sched: List[Schedule], deadline: Optional[float] = None) -> Tuple[List[Schedule], int]:
         best_sched = sched
         best_score = self._score_full_schedule(sched)
+        prefix_states = self._genre_prefix_states(best_sched)
+        score_states = self._score_states(best_sched)
+
+        # scratch copy mutated at one index per candidate and reverted on
+        # rejection, instead of prefix.copy() + extend per candidate
+        work = list(best_sched)
 
         for idx in range(len(sched)):
             if deadline and time.time() > deadline:
                 break
             prefix = best_sched[:idx]
             start_time = best_sched[idx].start
+            # the prefix is constant across the channel loop, so everything
+            # the penalty helpers derive from it is computed once here; delay
+            # is identically zero (programs always start on time)
+            last = prefix[-1] if prefix else None
+            last_channel_id = last.channel_id if last is not None else None
+            last_uid = last.unique_program_id if last is not None else None
+            last_end = last.end if last is not None else None
+            switch_pen = -self.instance_data.switch_penalty
+            term_pen = -self.instance_data.termination_penalty
             for ch_idx, ch in enumerate(self.instance_data.channels):
                 if deadline and time.time() > deadline:
                     break
+                # resolve the candidate through the same lookup the validator
+                # uses, so the program that gets vetted below is the program
+                # that gets inserted (the minute table now answers
+                # identically, but sharing the lookup keeps pick and vet from
+                # drifting apart again)
                 prog = Utils.get_channel_program_by_time(ch, start_time)
                 if not prog:
                     continue
                 if getattr(prog, "unique_id", None) == getattr(best_sched[idx], "unique_program_id", None):
                     continue
 
+                if not Validator.is_channel_valid(prefix, self.instance_data, ch_idx, start_time):
+                    continue
+
                 try:
-                    candidate = prefix.copy()
                     new_model = ScheduleModel(
                         program_id=prog.program_id,
                         channel_id=ch.channel_id,
                         start=prog.start,
                         end=prog.end,
                         fitness=int(
-                            getattr(prog, "score", 0)
+                            prog.score
                             + AlgorithmUtils.get_time_preference_bonus(self.instance_data, prog, start_time)
-                            + AlgorithmUtils.get_switch_penalty(prefix, self.instance_data, ch)
-                            + AlgorithmUtils.get_delay_penalty(prefix, self.instance_data, prog, start_time)
-                            + AlgorithmUtils.get_early_termination_penalty(prefix, self.instance_data, prog, start_time)
+                            + (switch_pen if last is not None and last_channel_id != ch.channel_id else 0)
+                            + (term_pen if last is not None and last_uid != prog.unique_id
+                               and prog.start < last_end else 0)
                         ),
                         unique_program_id=getattr(prog, "unique_id", prog.program_id),
+                        genre=getattr(prog, "genre", None),
                     )
-                    candidate.append(new_model)
-                    candidate.extend(best_sched[idx + 1 :])
 
-                    if not Validator.is_channel_valid(prefix, self.instance_data, ch_idx, start_time):
-                        continue
+                    old_entry = work[idx]
+                    work[idx] = new_model
 
-                    if not self._respects_genre_limit(candidate):
+                    # only index idx changed; resume the streak walk there
+                    if not self._respects_genre_limit_from(work, idx, prefix_states[idx]):
+                        work[idx] = old_entry
                         continue
 
-                    score_candidate = self._score_full_schedule(candidate)
+                    score_candidate = self._score_resume(work, idx, score_states[idx])
                     if score_candidate > best_score:
                         best_score = score_candidate
-                        best_sched = candidate
+                        best_sched = list(work)
+                        prefix_states = self._genre_prefix_states(best_sched)
+                        score_states = self._score_states(best_sched)
                         break
+                    work[idx] = old_entry
                 except Exception:
+                    # keep the scratch list in sync with the incumbent
+                    work[idx] = best_sched[idx]
                     continue
 
         return best_sched, int(best_score)
@@ -231,31 +332,52 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
     def _local_search_swap(self, sched: List[Schedule], deadline: Optional[float] = None) -> Tuple[List[Schedule], int]:
         best_sched = sched
         best_score = self._score_full_schedule(sched)
+        prefix_states = self._genre_prefix_states(best_sched)
+        score_states = self._score_states(best_sched)
         n = len(sched)
+
+        # A swap of i<j only disturbs the adjacent pairs around those two
+        # positions; every other pair keeps its ordering. Pre-recording which
+        # pairs are already out of order lets each (i, j) be feasibility-
+        # checked in O(1) instead of re-walking the whole candidate, and the
+        # list copy is only paid for pairs that can actually be legal.
+        bad_pairs = {k for k in range(1, n) if best_sched[k].start < best_sched[k - 1].end}
+
+        # one scratch copy for the whole search: each trial swaps in place and
+        # reverts on rejection instead of allocating a fresh n-entry list
+        work = list(best_sched)
+
         for i in range(n):
             if deadline and time.time() > deadline:
                 break
             for j in range(i + 1, n):
                 if deadline and time.time() > deadline:
                     break
-                candidate = best_sched.copy()
-                candidate[i], candidate[j] = candidate[j], candidate[i]
+                touched = (i, i + 1, j, j + 1)
+                if not bad_pairs.issubset(touched):
+                    continue
                 ok = True
-                for k in range(1, len(candidate)):
-                    if candidate[k].start < candidate[k - 1].end:
-                        ok = False
-                        break
+                for k in touched:
+                    if 1 <= k < n:
+                        prev = best_sched[i] if k - 1 == j else best_sched[j] if k - 1 == i else best_sched[k - 1]
+                        cur = best_sched[i] if k == j else best_sched[j] if k == i else best_sched[k]
+                        if cur.start < prev.end:
+                            ok = False
+                            break
                 if not ok:
                     continue
 
-                if not self._respects_genre_limit(candidate):
+                work[i], work[j] = work[j], work[i]
+
+                # entries before i are untouched by the swap
+                if not self._respects_genre_limit_from(work, i, prefix_states[i]):
+                    work[i], work[j] = work[j], work[i]
                     continue
 
-                score_candidate = self._score_full_schedule(candidate)
+                score_candidate = self._score_resume(work, i, score_states[i])
                 if score_candidate > best_score:
-                    best_score = score_candidate
-                    best_sched = candidate
-                    return best_sched, int(best_score)
+                    return work, int(score_candidate)
+                work[i], work[j] = work[j], work[i]
         return best_sched, int(best_score)
 
     def _apply_local_search(self, best_solution: Solution, deadline: Optional[float] = None) -> Solution:
@@ -291,29 +413,27 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         deadline = time.time() + time_limit if time_limit and time_limit > 0 else None
 
         current_dynamic_width = self.beam_width
-        for r in range(restarts):
-            self._restarts_run += 1
 
-            dynamic_width = max(1, int(current_dynamic_width))
+        def run_restart(r: int, dynamic_width: int) -> Optional[Solution]:
             print(f"[Restart {r + 1}/{restarts}] Beam width = {dynamic_width}")
-
-            scheduler = self._create_scheduler(dynamic_width)
             try:
-                candidate = scheduler.generate_solution()
+                return self._create_scheduler(dynamic_width).generate_solution()
             except Exception as exc:
                 print(f"WARNING: Restart {r + 1} failed: {exc}")
                 traceback.print_exc()
-                candidate = None
+                return None
 
+        def consume_restart(candidate: Optional[Solution]):
+            # shared bookkeeping for one finished restart: history, incumbent,
+            # dynamic-width feedback and the adaptive stagnation policy
+            nonlocal best_solution, best_score, current_dynamic_width
             if candidate is None:
-                continue
-
+                return
             if not self._respects_genre_limit(candidate.scheduled_programs):
-                continue
-
+                return
             score = self._safe_get_score(candidate)
             if score == -float("inf"):
-                continue
+                return
 
             self._best_score_history.append(score)
             if score > best_score:
@@ -328,9 +448,37 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
             if self._detect_stagnation():
                 self._apply_adaptive_restart_policy()
 
-            if deadline and time.time() > deadline:
-                print("[Main] time limit reached, stopping restarts loop.")
-                break
+        if deadline is None and restarts > 1:
+            # The restarts are independent beam runs merged by max score, so
+            # after one sequential seed round (which lets the dynamic width
+            # react once) the rest are dispatched to a process pool at the
+            # adjusted width. Time-limited runs stay sequential: they need the
+            # deadline checked between restarts.
+            self._restarts_run += 1
+            consume_restart(run_restart(0, max(1, int(current_dynamic_width))))
+
+            width = max(1, int(current_dynamic_width))
+            params = [(width, self.jump_cap, self.backtrack_window)] * (restarts - 1)
+            print(f"[Restart 2-{restarts}/{restarts}] Beam width = {width} (parallel)")
+            try:
+                workers = min(len(params), os.cpu_count() or 1)
+                candidates = map_over_instance(_run_restart_in_worker, self.instance_data,
+                                               params, max_workers=workers)
+            except Exception as exc:
+                print(f"WARNING: Parallel restarts failed ({exc}); falling back to sequential runs.")
+                traceback.print_exc()
+                candidates = [run_restart(r, width) for r in range(1, restarts)]
+            for candidate in candidates:
+                self._restarts_run += 1
+                consume_restart(candidate)
+        else:
+            for r in range(restarts):
+                self._restarts_run += 1
+                consume_restart(run_restart(r, max(1, int(current_dynamic_width))))
+
+                if deadline and time.time() > deadline:
+                    print("[Main] time limit reached, stopping restarts loop.")
+                    break
 
         if best_solution is None:
             best_solution = Solution(scheduled_programs=[], total_score=0)
@@ -339,24 +487,38 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         print(f"\nBest solution after {self._restarts_run} restarts: {best_score}")
 
         if self.iterative_deepening and self.max_beam_multiplier > 1:
+            no_improve_count = 0
             for mult in range(2, self.max_beam_multiplier + 1):
                 if deadline and time.time() > deadline:
                     print("[Iterative deepening] time limit reached, stopping iterative deepening.")
                     break
+                if best_score >= self._global_upper_bound:
+                    print("[Iterative deepening] incumbent matches the global upper bound, stopping.")
+                    break
                 dyn = max(1, int(self.beam_width * mult))
                 print(f"[Iterative deepening] trying beam_width={dyn} (x{mult})")
+                improved = False
                 try:
                     sched = self._create_scheduler(dyn)
                     cand = sched.generate_solution()
-                    if not self._respects_genre_limit(cand.scheduled_programs):
-                        continue
-                    sc = self._safe_get_score(cand)
-                    if sc > best_score:
-                        best_score = sc
-                        best_solution = cand
-                        print(f"  → Improved with beam_width={dyn}: {sc}")
+                    if self._respects_genre_limit(cand.scheduled_programs):
+                        sc = self._safe_get_score(cand)
+                        if sc > best_score:
+                            best_score = sc
+                            best_solution = cand
+                            improved = True
+                            print(f"  → Improved with beam_width={dyn}: {sc}")
                 except Exception as exc:
                     print(f"WARNING: iterative deepening run with multiplier {mult} failed: {exc}")
+                # wider beams keep getting more expensive; once the search
+                # plateaus twice in a row the rest are not worth running
+                if improved:
+                    no_improve_count = 0
+                else:
+                    no_improve_count += 1
+                    if no_improve_count >= 2:
+                        print("[Iterative deepening] no improvement in two rounds, stopping early.")
+                        break
 
         try:
             if best_solution and self.backtrack_window > 0:
@@ -398,13 +560,17 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         return list(self._best_score_history)
 
     def _lookup_program(self, channel_id: int, start_time: int):
-        try:
-            for ch in getattr(self.instance_data, "channels", []):
-                if getattr(ch, "channel_id", None) == channel_id:
-                    return Utils.get_channel_program_by_time(ch, start_time)
-        except Exception:
-            pass
-        return None
+        ch_idx = self._channel_idx_by_id.get(channel_id)
+        if ch_idx is None or start_time is None:
+            return None
+        instance = self.instance_data
+        off = start_time - instance.opening_time
+        row = instance.channel_minute_prog[ch_idx]
+        if 0 <= off < len(row):
+            p = row[off]
+            return instance.prog_refs[p] if p >= 0 else None
+        # outside the scheduling horizon: fall back to the bisect lookup
+        return Utils.get_channel_program_by_time(self._channel_by_id[channel_id], start_time)
 
     def _get_program_genre(self, sched_entry: Schedule) -> Optional[str]:
         prog = self._lookup_program(getattr(sched_entry, "channel_id", None), getattr(sched_entry, "start", None))
@@ -416,17 +582,55 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
         return str(g2) if g2 else None
 
     def _get_max_consecutive_genre(self) -> int:
-        return int(
-            getattr(
-                self.instance_data,
-                "max_same_gen_R",
-                getattr(
-                    self.instance_data,
-                    "max_consecutive_genre",
-                    getattr(self.instance_data, "genre_diversity_limit", 2),
-                ),
-            )
-        )
+        return self._genre_limit
+
+    def _genre_prefix_states(self, schedule: List[Schedule]) -> List[Tuple[Optional[str], int, bool]]:
+        """
+        Genre-streak state after every prefix of `schedule`: states[k] is
+        (last_genre, streak, valid_so_far) for schedule[:k]. Lets the local
+        searches re-validate only the indices a candidate actually changed
+        instead of rescanning from the front every time.
+        """
+        limit = self._get_max_consecutive_genre()
+        states: List[Tuple[Optional[str], int, bool]] = [(None, 0, True)]
+        last_genre: Optional[str] = None
+        streak = 0
+        valid = True
+        for sch in schedule:
+            g = self._get_program_genre(sch)
+            if g is None:
+                last_genre = None
+                streak = 0
+            elif g == last_genre:
+                streak += 1
+            else:
+                last_genre = g
+                streak = 1
+            if streak > limit:
+                valid = False
+            states.append((last_genre, streak, valid))
+        return states
+
+    def _respects_genre_limit_from(self, schedule: List[Schedule], start_idx: int,
+                                   state: Tuple[Optional[str], int, bool]) -> bool:
+        last_genre, streak, valid = state
+        if not valid:
+            return False
+        limit = self._get_max_consecutive_genre()
+        for k in range(start_idx, len(schedule)):
+            g = self._get_program_genre(schedule[k])
+            if g is None:
+                last_genre = None
+                streak = 0
+                continue
+            if g == last_genre:
+                streak += 1
+            else:
+                last_genre = g
+                streak = 1
+            if streak > limit:
+                return False
+        return True
 
     def _respects_genre_limit(self, schedule: List[Schedule]) -> bool:
         limit = self._get_max_consecutive_genre()
@@ -447,39 +651,137 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
                 return False
         return True
 
-    def _score_full_schedule(self, schedule: List[Schedule]) -> int:
+    # state: (total, v_last, v_streak, v_valid, s_last, s_streak, recent_genres)
+    # where v_* is the genre-limit validator walk and s_*/recent the scorer's
+    # own streak and diversity-window state
+    _SCORE_STATE_INIT = (0, None, 0, True, None, 0, ())
+
+    def _score_states(self, schedule: List[Schedule]) -> List[tuple]:
+        """
+        Scoring state after every prefix of `schedule`; feeding states[k] to
+        _score_resume(schedule, k, ...) reproduces _score_full_schedule while
+        only walking the entries from k on. Lets the local searches score a
+        candidate in O(n - first_changed_index) instead of O(n).
+        """
+        states = [self._SCORE_STATE_INIT]
+        state = self._SCORE_STATE_INIT
+        for idx in range(len(schedule)):
+            state = self._score_step(schedule, idx, state)
+            states.append(state)
+        return states
+
+    def _score_step(self, schedule: List[Schedule], idx: int, state: tuple) -> tuple:
+        total, v_last, v_streak, v_valid, s_last, s_streak, recent = state
+        limit = self._genre_limit
+        genre_window = self._genre_window
+        genre_diversity_bonus = self._genre_diversity_bonus
+        same_genre_chain_penalty = self._same_genre_chain_penalty
+
+        sch = schedule[idx]
+        total += sch.fitness
+
+        if idx > 0:
+            prev = schedule[idx - 1]
+            if sch.start < prev.end:
+                if prev.channel_id == sch.channel_id:
+                    total -= self._overlap_penalty
+                else:
+                    total -= self._misorder_penalty
+            if prev.channel_id != sch.channel_id:
+                total -= self._switch_penalty
+
+        g = self._get_program_genre(sch)
+        # validator walk (same semantics as _respects_genre_limit)
+        if g is None:
+            v_last, v_streak = None, 0
+        elif g == v_last:
+            v_streak += 1
+        else:
+            v_last, v_streak = g, 1
+        if v_streak > limit:
+            v_valid = False
+
+        # scorer walk (same semantics as _score_full_schedule's own tracking)
+        if g is not None:
+            if g == s_last:
+                s_streak += 1
+                total -= same_genre_chain_penalty
+            else:
+                s_streak = 0
+                s_last = g
+            # the window holds per-genre bits, so the unique count is the
+            # popcount of their union rather than a freshly built set
+            bit = self._genre_bit.setdefault(g, 1 << len(self._genre_bit))
+            recent = (recent + (bit,))[-genre_window:]
+            mask = 0
+            for b in recent:
+                mask |= b
+            total += genre_diversity_bonus * max(0, mask.bit_count() - 1)
+
+        return (total, v_last, v_streak, v_valid, s_last, s_streak, recent)
+
+    def _score_resume(self, schedule: List[Schedule], start_idx: int, state: tuple) -> int:
         if not schedule:
             return 0
-
-        if not self._respects_genre_limit(schedule):
+        for idx in range(start_idx, len(schedule)):
+            state = self._score_step(schedule, idx, state)
+        if not state[3]:
             return -10**9
+        return int(state[0])
+
+    def _score_full_schedule(self, schedule: List[Schedule]) -> int:
+        if not schedule:
+            return 0
 
-        overlap_penalty = int(getattr(self.instance_data, "overlap_penalty", 10_000))
-        misorder_penalty = int(getattr(self.instance_data, "misorder_penalty", 1_000))
-        genre_window = max(1, int(getattr(self.instance_data, "genre_window", 3)))
-        genre_diversity_bonus = int(getattr(self.instance_data, "genre_diversity_bonus", 5))
-        same_genre_chain_penalty = int(getattr(self.instance_data, "same_genre_chain_penalty", 8))
+        overlap_penalty = self._overlap_penalty
+        misorder_penalty = self._misorder_penalty
+        genre_window = self._genre_window
+        genre_diversity_bonus = self._genre_diversity_bonus
+        same_genre_chain_penalty = self._same_genre_chain_penalty
+        switch_penalty = self._switch_penalty
+        limit = self._genre_limit
 
         total = 0
-        recent_genres: List[Optional[str]] = []
+        # O(1) window maintenance: deque evicts the oldest genre on append
+        # and counts/unique_count track window membership incrementally, so
+        # no per-entry list shift or set rebuild
+        recent_genres: deque = deque(maxlen=genre_window)
+        counts: dict = {}
+        unique_count = 0
         last_genre: Optional[str] = None
         same_genre_streak = 0
-
+        # genre-limit walk fused into the same pass (validator semantics:
+        # reset on a genre-less entry, streak restarts at 1 on a change) so
+        # the schedule is not pre-traversed by _respects_genre_limit
+        v_last: Optional[str] = None
+        v_streak = 0
+
+        # Schedule always carries these fields, so the loop reads them
+        # directly instead of through defaulted getattr calls
         for idx, sch in enumerate(schedule):
-            total += getattr(sch, "fitness", 0)
+            total += sch.fitness
 
             if idx > 0:
                 prev = schedule[idx - 1]
-                if getattr(sch, "start", 0) < getattr(prev, "end", 0):
-                    if getattr(prev, "channel_id", None) == getattr(sch, "channel_id", None):
+                if sch.start < prev.end:
+                    if prev.channel_id == sch.channel_id:
                         total -= overlap_penalty
                     else:
                         total -= misorder_penalty
-                if getattr(prev, "channel_id", None) != getattr(sch, "channel_id", None):
-                    total -= int(getattr(self.instance_data, "switch_penalty", 0))
+                if prev.channel_id != sch.channel_id:
+                    total -= switch_penalty
 
             g = self._get_program_genre(sch)
-            if g is not None:
+            if g is None:
+                v_last, v_streak = None, 0
+            else:
+                if g == v_last:
+                    v_streak += 1
+                else:
+                    v_last, v_streak = g, 1
+                if v_streak > limit:
+                    return -10**9
+
                 if g == last_genre:
                     same_genre_streak += 1
                     total -= same_genre_chain_penalty
@@ -487,10 +789,15 @@ class BeyondDynamicBeamSearchSchedulerAdvanced:
                     same_genre_streak = 0
                     last_genre = g
 
+                if len(recent_genres) == genre_window:
+                    old = recent_genres[0]
+                    counts[old] -= 1
+                    if counts[old] == 0:
+                        unique_count -= 1
                 recent_genres.append(g)
-                if len(recent_genres) > genre_window:
-                    recent_genres.pop(0)
-                unique_in_window = len(set([gg for gg in recent_genres if gg is not None]))
-                total += genre_diversity_bonus * max(0, unique_in_window - 1)
+                if counts.get(g, 0) == 0:
+                    unique_count += 1
+                counts[g] = counts.get(g, 0) + 1
+                total += genre_diversity_bonus * max(0, unique_count - 1)
 
         return int(total)
@@ -1,3 +1,5 @@
+import heapq
+from bisect import bisect_right
 from typing import Tuple
 from models.instance_data import InstanceData
 from models.schedule import Schedule
@@ -9,43 +11,56 @@ from models.schedule import Schedule as ScheduleModel
 
 class GreedyLookahead:
 
-    def __init__(self, instance_data: InstanceData):
+    def __init__(self, instance_data: InstanceData, top_k: int = 12):
         self.instance_data = instance_data
+        # only the top_k candidates by immediate score get the (expensive)
+        # one-step lookahead; the rest are pruned branch-and-bound style
+        self.top_k = max(2, top_k)
+        # (plan length, last uid, time) -> valid channel indexes; the plan is
+        # append-only within a run, so length plus the last entry pins down the
+        # exact plan and the result can be reused between the per-candidate
+        # lookahead call and the per-tick call at the same moment
+        self._valid_cache: dict = {}
 
     def generate_solution(self) -> Solution:
         # Deterministic single pass
         solution, total_score = self._single_run()
         return Solution(scheduled_programs=solution, total_score=total_score)
 
+    def _valid_channels(self, schedule_plan: list[Schedule], schedule_time: int) -> list[int]:
+        key = (len(schedule_plan),
+               schedule_plan[-1].unique_program_id if schedule_plan else None,
+               schedule_time)
+        cached = self._valid_cache.get(key)
+        if cached is None:
+            cached = SchedulerUtils.get_valid_schedules(scheduled_programs=schedule_plan,
+                                                        instance_data=self.instance_data,
+                                                        schedule_time=schedule_time)
+            self._valid_cache[key] = cached
+        return cached
+
     def _single_run(self) -> Tuple[list[Schedule], int]:
+        self._valid_cache.clear()
         time = self.instance_data.opening_time
         # Build a local cache: channel object id -> index to avoid repeated enumerate
         channel_to_index = {id(ch): idx for idx, ch in enumerate(self.instance_data.channels)}
+        # Sorted program starts (from the flattened instance arrays) for minute-skipping
+        all_starts = sorted(set(self.instance_data.prog_start))
 
         total_score = 0
         solution: list[Schedule] = []
 
         while time < self.instance_data.closing_time:
-            valid_channel_indexes = SchedulerUtils.get_valid_schedules(scheduled_programs=solution,
-                                                                       instance_data=self.instance_data,
-                                                                       schedule_time=time)
+            valid_channel_indexes = self._valid_channels(solution, time)
             if not valid_channel_indexes:
-                # minute-skipping: jump to next earliest program start among all channels >= time
-                next_start = None
-                for ch in self.instance_data.channels:
-                    for p in ch.programs:
-                        if p.start > time:
-                            if next_start is None or p.start < next_start:
-                                next_start = p.start
-                time = next_start if next_start is not None else time + 1
+                # minute-skipping: jump to next earliest program start among all channels > time
+                pos = bisect_right(all_starts, time)
+                time = all_starts[pos] if pos < len(all_starts) else time + 1
                 continue
 
-            # Evaluate candidates using 1-step lookahead: choose program now and add best next choice at its end
-            max_score = float('-inf')
-            best_channel = None
-            best_program = None
-
-            for channel_index in valid_channel_indexes:
+            # First pass: cheap immediate scores for every valid channel
+            candidates = []  # (score_now, -order, channel, program)
+            for order, channel_index in enumerate(valid_channel_indexes):
                 channel = self.instance_data.channels[channel_index]
                 # Lookup current program
                 program = Utils.get_channel_program_by_time(channel, time)
@@ -61,24 +76,42 @@ class GreedyLookahead:
                 score_now += AlgorithmUtils.get_delay_penalty(solution, self.instance_data, program, time)
                 score_now += AlgorithmUtils.get_early_termination_penalty(solution, self.instance_data, program, time)
 
-                # Build a temporary schedule to simulate the state after picking this program
+                candidates.append((score_now, -order, channel, program))
+
+            # Second pass: run the 1-step lookahead only on the top_k by
+            # immediate score, evaluated in the original channel order so
+            # tie-breaking matches the unpruned loop
+            if len(candidates) > self.top_k:
+                candidates = heapq.nlargest(self.top_k, candidates, key=lambda c: (c[0], c[1]))
+            candidates.sort(key=lambda c: c[1], reverse=True)
+
+            max_score = float('-inf')
+            best_channel = None
+            best_program = None
+            best_score_now = 0
+
+            for score_now, _neg_order, channel, program in candidates:
+                # Build a temporary schedule to simulate the state after picking
+                # this program; appended in place and popped after evaluation so
+                # no n+1 sized copy of the plan is made per candidate
                 temp_schedule = ScheduleModel(program_id=program.program_id, channel_id=channel.channel_id,
                                               start=program.start, end=program.end, fitness=int(score_now),
-                                              unique_program_id=program.unique_id)
-                simulated_plan = solution + [temp_schedule]
+                                              unique_program_id=program.unique_id, genre=program.genre)
+                solution.append(temp_schedule)
 
                 # Evaluate best next choice at program.end (next scheduling moment)
-                future_best = 0
-                future_time = program.end
-                if future_time < self.instance_data.closing_time:
-                    valid_next = SchedulerUtils.get_valid_schedules(scheduled_programs=simulated_plan,
-                                                                    instance_data=self.instance_data,
-                                                                    schedule_time=future_time)
-                    if valid_next:
-                        _, _, future_best = AlgorithmUtils.get_best_fit(scheduled_programs=simulated_plan,
-                                                                       instance_data=self.instance_data,
-                                                                       schedule_time=future_time,
-                                                                       valid_channel_indexes=valid_next)
+                try:
+                    future_best = 0
+                    future_time = program.end
+                    if future_time < self.instance_data.closing_time:
+                        valid_next = self._valid_channels(solution, future_time)
+                        if valid_next:
+                            _, _, future_best = AlgorithmUtils.get_best_fit(scheduled_programs=solution,
+                                                                            instance_data=self.instance_data,
+                                                                            schedule_time=future_time,
+                                                                            valid_channel_indexes=valid_next)
+                finally:
+                    solution.pop()
 
                 # Total score for selection purposes (includes future lookahead)
                 score = score_now + future_best
@@ -87,18 +120,11 @@ class GreedyLookahead:
                     max_score = score
                     best_channel = channel
                     best_program = program
+                    best_score_now = score_now
 
-            # Fitness for THIS step only (not including future lookahead)
-            # We need to recalculate score_now for the selected program
-            if best_program:
-                fitness = 0
-                fitness += best_program.score
-                fitness += AlgorithmUtils.get_time_preference_bonus(self.instance_data, best_program, time)
-                fitness += AlgorithmUtils.get_switch_penalty(solution, self.instance_data, best_channel)
-                fitness += AlgorithmUtils.get_delay_penalty(solution, self.instance_data, best_program, time)
-                fitness += AlgorithmUtils.get_early_termination_penalty(solution, self.instance_data, best_program, time)
-            else:
-                fitness = 0
+            # Fitness for THIS step only (not including future lookahead);
+            # reuse the already-computed immediate score of the winner
+            fitness = best_score_now if best_program else 0
 
             # Remove the incorrect condition preventing same channel consecutively
             # Also check that we found a valid program
@@ -126,7 +152,7 @@ class GreedyLookahead:
             # Use the program's actual start and end times
             schedule = Schedule(program_id=best_program.program_id, channel_id=best_channel.channel_id,
                                 start=best_program.start, end=best_program.end, fitness=fitness,
-                                unique_program_id=best_program.unique_id)
+                                unique_program_id=best_program.unique_id, genre=best_program.genre)
 
             solution.append(schedule)
             # Move time to the end of the scheduled program
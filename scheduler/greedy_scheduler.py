@@ -1,63 +1,167 @@
+from bisect import bisect_right
+
 from models.instance_data import InstanceData
 from models.schedule import Schedule
 from models.solution import Solution
-from utils.algorithm_utils import AlgorithmUtils
-from utils.scheduler_utils import SchedulerUtils
 
 
-class GreedyScheduler:
+def _precompute_static_scores(starts, ends, scores, channel_ids, genre_ids,
+                              pref_windows, blocked_ranges):
+    """
+    Fold the per-candidate preference-bonus and priority-block loops into one
+    precomputed pass: static_score[p] is the program's score plus every
+    matching preference bonus, or None when a priority block forbids it.
+    """
+    static_scores = []
+    for p in range(len(starts)):
+        blocked = False
+        for b_start, b_end, allowed in blocked_ranges:
+            if starts[p] < b_end and ends[p] > b_start and channel_ids[p] not in allowed:
+                blocked = True
+                break
+        if blocked:
+            static_scores.append(None)
+            continue
+        score = scores[p]
+        for w_start, w_end, w_genre_id, bonus in pref_windows:
+            if genre_ids[p] == w_genre_id and starts[p] < w_end and ends[p] > w_start:
+                score += bonus
+        static_scores.append(score)
+    return static_scores
 
-    def __init__(self, instance_data: InstanceData):
-        self.instance_data = instance_data
 
-    def generate_solution(self) -> Solution:
-        time = self.instance_data.opening_time
+def _greedy_kernel(starts, ends, scores, channel_ids, genre_ids,
+                   channel_prog_index, channel_prog_starts,
+                   opening, closing, min_duration, max_consecutive_genre,
+                   switch_penalty, termination_penalty,
+                   pref_windows, blocked_ranges):
+    """
+    Inner greedy loop over the flattened program arrays.
 
-        total_score = 0
-        solution = []
+    Operates purely on ints and flat lists (no Program/Channel objects) so the
+    hot loop avoids attribute lookups entirely. Returns the chosen flat program
+    indices, their fitness values and the total score; Schedule objects are
+    rebuilt by the caller.
+    """
+    static_scores = _precompute_static_scores(starts, ends, scores, channel_ids,
+                                              genre_ids, pref_windows, blocked_ranges)
 
-        while time < self.instance_data.closing_time:
-            valid_channel_indexes = SchedulerUtils.get_valid_schedules(scheduled_programs=solution,
-                                                                       instance_data=self.instance_data,
-                                                                       schedule_time=time)
-            if not valid_channel_indexes:
-                time += 1
-                continue
+    # Between two consecutive program starts/ends the candidate set and every
+    # candidate score are constant, so a rejected minute means the whole gap
+    # up to the next event is rejected too and the loop can jump straight to it.
+    event_times = sorted(set(starts) | set(ends))
+    n_events = len(event_times)
 
-            best_channel, channel_program, fitness = AlgorithmUtils.get_best_fit(scheduled_programs=solution,
-                                                                                 instance_data=self.instance_data,
-                                                                                 schedule_time=time,
-                                                                                 valid_channel_indexes=valid_channel_indexes)
+    chosen = []
+    fitnesses = []
+    total_score = 0
 
-            if not best_channel or not channel_program or fitness <= 0:
-                time += 1
-                continue
+    last_idx = -1          # flat index of the last scheduled program
+    last_start = -1
+    last_end = -1
+    last_channel_id = -1
+    genre_streak = 0       # consecutive schedules sharing last_genre_id
+    last_genre_id = -1
+
+    time = opening
+    while time < closing:
+        # channel-independent time constraints
+        if time + min_duration > closing:
+            break
+        if last_idx != -1 and time < last_start + min_duration:
+            time = last_start + min_duration
+            continue
 
-            # Check if we're trying to schedule the exact same program again
-            if solution and solution[-1].unique_program_id == channel_program.unique_id:
-                time += 1
+        best_idx = -1
+        best_score = 0
+
+        for ch_idx, prog_indices in enumerate(channel_prog_index):
+            ch_starts = channel_prog_starts[ch_idx]
+            pos = bisect_right(ch_starts, time) - 1
+            if pos < 0:
+                continue
+            p = prog_indices[pos]
+            if not (starts[p] <= time < ends[p]):
                 continue
 
-            # Check if this program would overlap with the previous program
-            if solution and channel_program.start < solution[-1].end:
-                # Can't schedule - would create overlap
-                time += 1
+            # max consecutive genre
+            if last_idx != -1 and genre_ids[p] == last_genre_id and genre_streak + 1 > max_consecutive_genre:
                 continue
 
-            # Check if this program meets minimum duration requirement
-            if channel_program.end - channel_program.start < self.instance_data.min_duration:
-                # Program itself is too short
-                time += 1
+            score = static_scores[p]
+            if score is None:  # forbidden by a priority block
                 continue
+            if last_idx != -1:
+                if channel_ids[p] != last_channel_id:
+                    score -= switch_penalty
+                if p != last_idx and starts[p] < last_end:
+                    score -= termination_penalty
+
+            if score > best_score:
+                best_score = score
+                best_idx = p
+
+        p = best_idx
+        if (p == -1 or p == last_idx
+                or (last_idx != -1 and starts[p] < last_end)
+                or ends[p] - starts[p] < min_duration):
+            nxt = bisect_right(event_times, time)
+            time = event_times[nxt] if nxt < n_events else closing
+            continue
+
+        chosen.append(p)
+        fitnesses.append(best_score)
+        total_score += best_score
 
-            # Use the program's actual start and end times
-            schedule = Schedule(program_id=channel_program.program_id, channel_id=best_channel.channel_id,
-                                start=channel_program.start, end=channel_program.end, fitness=fitness,
-                                unique_program_id=channel_program.unique_id)
+        last_idx = p
+        last_start = starts[p]
+        last_end = ends[p]
+        last_channel_id = channel_ids[p]
+        if genre_ids[p] == last_genre_id:
+            genre_streak += 1
+        else:
+            last_genre_id = genre_ids[p]
+            genre_streak = 1
 
-            solution.append(schedule)
-            # Move time to the end of the scheduled program
-            time = channel_program.end
-            total_score += fitness
+        time = ends[p]
+
+    return chosen, fitnesses, total_score
+
+
+class GreedyScheduler:
+
+    def __init__(self, instance_data: InstanceData):
+        self.instance_data = instance_data
+
+    def generate_solution(self) -> Solution:
+        instance = self.instance_data
+
+        pref_windows = [
+            (pref.start, pref.end, instance.genre_to_id.get(pref.preferred_genre, -1), pref.bonus)
+            for pref in instance.time_preferences
+        ]
+        blocked_ranges = [
+            # allowed_channels is already a frozenset from the parser
+            (block.start, block.end, block.allowed_channels)
+            for block in instance.priority_blocks
+        ]
+
+        chosen, fitnesses, total_score = _greedy_kernel(
+            instance.prog_start, instance.prog_end, instance.prog_score,
+            instance.prog_channel_id, instance.prog_genre_id,
+            instance.channel_prog_index, instance.channel_prog_starts,
+            instance.opening_time, instance.closing_time,
+            instance.min_duration, instance.max_consecutive_genre,
+            instance.switch_penalty, instance.termination_penalty,
+            pref_windows, blocked_ranges
+        )
+
+        solution = []
+        for p, fitness in zip(chosen, fitnesses):
+            program = instance.prog_refs[p]
+            solution.append(Schedule(program_id=program.program_id,
+                                     channel_id=instance.prog_channel_id[p],
+                                     start=program.start, end=program.end, fitness=fitness,
+                                     unique_program_id=program.unique_id, genre=program.genre))
 
         return Solution(scheduled_programs=solution, total_score=total_score)
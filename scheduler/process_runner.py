@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor
+
+# Instance installed once per worker process by _init_worker, so repeated
+# tasks against the same InstanceData do not re-pickle it per task.
+_shared_instance = None
+
+
+def _init_worker(instance):
+    global _shared_instance
+    _shared_instance = instance
+
+
+def _call_shared(task):
+    fn, arg = task
+    return fn(_shared_instance, arg)
+
+
+def map_over_instance(fn, instance, args_list, max_workers=None):
+    """
+    Run fn(instance, arg) for every arg in args_list across a process pool.
+
+    The parsed InstanceData is shipped to each worker exactly once (via the
+    pool initializer) instead of once per task; with the fork start method the
+    pages are additionally shared copy-on-write with the parent.
+    """
+    tasks = [(fn, arg) for arg in args_list]
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker,
+                             initargs=(instance,)) as executor:
+        return list(executor.map(_call_shared, tasks))
+
+
+def _generate(scheduler):
+    return scheduler.generate_solution()
+
+
+def run_scheduler_in_worker(scheduler):
+    """
+    Run scheduler.generate_solution() in a dedicated worker process.
+
+    The scheduler (with its instance data) is shipped to the worker once and
+    only the finished Solution travels back, so beam-search working memory
+    (beams, caches, skip tables) is reclaimed with the worker process instead
+    of lingering in the main interpreter.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_generate, scheduler).result()
@@ -33,6 +33,14 @@ class UpperBoundGreedy(GreedyScheduler):
 
         all_programs.sort(key=lambda x: x[0].score, reverse=True)
 
+        # preference fields unpacked once and bucketed by interned genre id,
+        # so each program only walks the handful of preferences that could
+        # possibly match instead of the whole list
+        prefs_by_genre: dict = {}
+        for pref in self.instance_data.time_preferences:
+            prefs_by_genre.setdefault(pref.preferred_genre_id, []).append(
+                (pref.start, pref.end, pref.bonus))
+
         for prog, ch in all_programs:
             if current_time >= closing:
                 break
@@ -43,12 +51,9 @@ class UpperBoundGreedy(GreedyScheduler):
 
             fitness = prog.score
 
-            for pref in self.instance_data.time_preferences:
-                if (
-                    pref.preferred_genre.lower() == prog.genre.lower()
-                    and not (end <= pref.start or start >= pref.end)
-                ):
-                    fitness += pref.bonus
+            for pref_start, pref_end, pref_bonus in prefs_by_genre.get(prog.genre_id, ()):
+                if not (end <= pref_start or start >= pref_end):
+                    fitness += pref_bonus
 
             relaxed_schedules.append(
                 Schedule(
@@ -58,6 +63,7 @@ class UpperBoundGreedy(GreedyScheduler):
                     end=end,
                     fitness=fitness,
                     unique_program_id=prog.unique_id,
+                    genre=prog.genre,
                 )
             )
 
@@ -1,6 +1,11 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.solution import Solution
 
 
@@ -40,8 +45,13 @@ class SolutionSerializer:
         }
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-                print(f"[INFO] Result saved to the file: {output_path}")
+            if orjson is not None:
+                # orjson dumps straight to bytes in C, far faster than json.dump
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=4, ensure_ascii=False)
+            print(f"[INFO] Result saved to the file: {output_path}")
         except Exception as e:
             print(f"[ERROR] Serialization failed: {e}")
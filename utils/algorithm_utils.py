@@ -19,6 +19,15 @@ class AlgorithmUtils:
         best_channel = None
         best_program = None
 
+        # the last scheduled entry is the same for every candidate, so its
+        # fields are pulled out once here instead of per helper call
+        last = scheduled_programs[-1] if scheduled_programs else None
+        last_channel_id = last.channel_id if last is not None else None
+        last_uid = last.unique_program_id if last is not None else None
+        last_end = last.end if last is not None else None
+        switch_penalty = instance_data.switch_penalty
+        termination_penalty = instance_data.termination_penalty
+
         for channel_index in valid_channel_indexes:
             channel = instance_data.channels[channel_index]
             program = Utils.get_channel_program_by_time(channel, schedule_time)
@@ -26,13 +35,21 @@ class AlgorithmUtils:
             if not program:
                 continue
 
-            score = 0
-
-            score += program.score
+            # lazy evaluation: score + bonus is an upper bound on the final
+            # fitness (the remaining terms only subtract), so a candidate that
+            # cannot beat the incumbent skips the penalty computation entirely
+            score = program.score
             score += AlgorithmUtils.get_time_preference_bonus(instance_data, program, schedule_time)
-            score += AlgorithmUtils.get_switch_penalty(scheduled_programs, instance_data, channel)
-            score += AlgorithmUtils.get_delay_penalty(scheduled_programs, instance_data, program, schedule_time)
-            score += AlgorithmUtils.get_early_termination_penalty(scheduled_programs, instance_data, program, schedule_time)
+            if score <= max_score:
+                continue
+
+            # same terms as get_switch_penalty / get_delay_penalty /
+            # get_early_termination_penalty, on the hoisted scalars
+            if last is not None:
+                if last_channel_id != channel.channel_id:
+                    score -= switch_penalty
+                if last_uid != program.unique_id and program.start < last_end:
+                    score -= termination_penalty
 
             if score > max_score:
                 max_score = score
@@ -48,6 +65,11 @@ class AlgorithmUtils:
         The bonus applies if the program airs during the preferred time window.
         We check if the program's broadcast time overlaps with the preference window.
         """
+        # resolved once per program when InstanceData builds its arrays
+        cached = getattr(program, "pref_bonus", None)
+        if cached is not None:
+            return cached
+
         score = 0
         for preference in instance_data.time_preferences:
             if program.genre == preference.preferred_genre:
@@ -10,10 +10,18 @@ class SchedulerUtils:
     @staticmethod
     def get_valid_schedules(scheduled_programs: List[Schedule], instance_data: InstanceData, schedule_time: int) -> List[
         int]:
+        # The schedule-time and min-duration checks do not depend on the
+        # channel, so run them once per tick instead of once per channel; if
+        # either fails, no channel can be valid at this time.
+        if not (Validator.check_schedule_time(instance_data, schedule_time)
+                and Validator.check_min_duration(scheduled_programs, instance_data, schedule_time)):
+            return []
+
         valid_channels = []
 
         for channel_index, _ in enumerate(instance_data.channels):
-            if Validator.is_channel_valid(scheduled_programs, instance_data, channel_index, schedule_time):
+            if (Validator.check_max_consecutive_genre(scheduled_programs, instance_data, channel_index, schedule_time)
+                    and Validator.check_priority_time_block(instance_data, channel_index, schedule_time)):
                 valid_channels.append(channel_index)
 
         return valid_channels
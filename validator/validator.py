@@ -11,69 +11,102 @@ class Validator:
     @staticmethod
     def is_channel_valid(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
                          schedule_time: int):
-        try:
-            Validator.validate_schedule_time(instance_data, schedule_time)
-            Validator.validate_min_duration(schedule_plan, instance_data, schedule_time)
-            Validator.validate_max_consecutive_genre(schedule_plan, instance_data, channel_index, schedule_time)
-            Validator.validate_priority_time_block(instance_data, channel_index, schedule_time)
-        except ConstraintException:
-            return False
-
-        return True
+        # boolean checks short-circuit on the first violation; raising and
+        # catching an exception per rejected channel is far more expensive
+        # and rejection is the common case
+        return (Validator.check_schedule_time(instance_data, schedule_time)
+                and Validator.check_min_duration(schedule_plan, instance_data, schedule_time)
+                and Validator.check_max_consecutive_genre(schedule_plan, instance_data, channel_index, schedule_time)
+                and Validator.check_priority_time_block(instance_data, channel_index, schedule_time))
 
     @staticmethod
-    def validate_schedule_time(instance_data: InstanceData, schedule_time: int):
+    def check_schedule_time(instance_data: InstanceData, schedule_time: int) -> bool:
         # Check if the schedule time is within bounds and has enough room for min_duration
-        if (schedule_time < instance_data.opening_time or 
-                schedule_time >= instance_data.closing_time or
-                schedule_time + instance_data.min_duration > instance_data.closing_time):
-            raise ConstraintException("Schedule time is invalid!")
+        return not (schedule_time < instance_data.opening_time or
+                    schedule_time >= instance_data.closing_time or
+                    schedule_time + instance_data.min_duration > instance_data.closing_time)
 
     @staticmethod
-    def validate_min_duration(schedule_plan: List[Schedule], instance_data: InstanceData, schedule_time: int):
+    def check_min_duration(schedule_plan: List[Schedule], instance_data: InstanceData, schedule_time: int) -> bool:
         if not schedule_plan:
-            return
+            return True
 
         last_schedule = schedule_plan[-1]
-        if schedule_time < last_schedule.start + instance_data.min_duration:
-            raise ConstraintException("min_duration for broadcasting channel has not been reached.")
+        return schedule_time >= last_schedule.start + instance_data.min_duration
 
     @staticmethod
-    def validate_max_consecutive_genre(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
-                                       schedule_time: int):
+    def check_max_consecutive_genre(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
+                                    schedule_time: int) -> bool:
         if not schedule_plan:
-            return
+            return True
 
         channel_to_insert = instance_data.channels[channel_index]
         program = Utils.get_channel_program_by_time(channel_to_insert, schedule_time)
 
         if not program:
-            return
+            return True
 
         count = 0
+        program_genre = program.genre
+        max_run = instance_data.max_consecutive_genre
         for schedule in reversed(schedule_plan):
-            scheduled_program = Utils.get_program_by_unique_id(instance_data, schedule.unique_program_id)
-            if scheduled_program.genre != program.genre:
+            genre = schedule.genre
+            if genre is None:
+                # entry built without its genre; resolve it the old way
+                genre = Utils.get_program_by_unique_id(instance_data, schedule.unique_program_id).genre
+            if genre != program_genre:
                 break
             count += 1
+            if count + 1 > max_run:
+                # already enough matches to reject; no need to measure the
+                # full run, which bounds the walk at max_run entries
+                break
 
         # Max R consecutive means we can have R programs, so reject if count + 1 > R
-        if count + 1 > instance_data.max_consecutive_genre:
-            raise ConstraintException("max consecutive genre has been reached.")
+        return count + 1 <= max_run
 
     @staticmethod
-    def validate_priority_time_block(instance_data: InstanceData, channel_index: int, schedule_time: int):
+    def check_priority_time_block(instance_data: InstanceData, channel_index: int, schedule_time: int) -> bool:
         channel_to_insert = instance_data.channels[channel_index]
-        channel_to_insert_id = channel_to_insert.channel_id
-        
+
         # Get the actual program that would be scheduled
         program = Utils.get_channel_program_by_time(channel_to_insert, schedule_time)
         if not program:
-            return
-        
-        # Check if the program's duration overlaps with any priority block
-        for block in instance_data.priority_blocks:
-            # Check if program's time range [program.start, program.end) overlaps with block [block.start, block.end)
-            if (program.start < block.end and program.end > block.start and 
-                    channel_to_insert_id not in block.allowed_channels):
-                raise ConstraintException("Channel not allowed in priority block.")
+            return True
+
+        # Program spans are fixed, so overlap with the priority blocks was
+        # resolved once per program when the instance arrays were built.
+        blocked = getattr(program, "blocked", None)
+        if blocked is None:
+            blocked = False
+            channel_to_insert_id = channel_to_insert.channel_id
+            for block in instance_data.priority_blocks:
+                if (program.start < block.end and program.end > block.start and
+                        channel_to_insert_id not in block.allowed_channels):
+                    blocked = True
+                    break
+        return not blocked
+
+    # Raising wrappers kept for callers that still report violations as
+    # ConstraintException.
+
+    @staticmethod
+    def validate_schedule_time(instance_data: InstanceData, schedule_time: int):
+        if not Validator.check_schedule_time(instance_data, schedule_time):
+            raise ConstraintException("Schedule time is invalid!")
+
+    @staticmethod
+    def validate_min_duration(schedule_plan: List[Schedule], instance_data: InstanceData, schedule_time: int):
+        if not Validator.check_min_duration(schedule_plan, instance_data, schedule_time):
+            raise ConstraintException("min_duration for broadcasting channel has not been reached.")
+
+    @staticmethod
+    def validate_max_consecutive_genre(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
+                                       schedule_time: int):
+        if not Validator.check_max_consecutive_genre(schedule_plan, instance_data, channel_index, schedule_time):
+            raise ConstraintException("max consecutive genre has been reached.")
+
+    @staticmethod
+    def validate_priority_time_block(instance_data: InstanceData, channel_index: int, schedule_time: int):
+        if not Validator.check_priority_time_block(instance_data, channel_index, schedule_time):
+            raise ConstraintException("Channel not allowed in priority block.")